@@ -0,0 +1,8 @@
+"""Compatibility helpers for older Python versions."""
+
+import sys
+
+
+# Keyword arguments for @dataclass that give instances __slots__ where supported
+# (slots=True needs Python 3.10+; older versions fall back to a regular __dict__).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
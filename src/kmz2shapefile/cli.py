@@ -6,6 +6,7 @@ from pathlib import Path
 import click
 
 from .converter import KMZConverter
+from .shapefile_builder import ENGINES
 from .exceptions import ConversionError
 
 
@@ -17,9 +18,23 @@ from .exceptions import ConversionError
     is_flag=True,
     help='Include features with null geometry (creates features without geometry)'
 )
+@click.option(
+    '-j', '--workers',
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help='Number of parallel workers for parsing and writing (0 = one per CPU core)'
+)
+@click.option(
+    '--engine',
+    type=click.Choice(ENGINES),
+    default='fiona',
+    show_default=True,
+    help='Shapefile writer backend (pyogrio requires the "fast" extra)'
+)
 @click.option('-v', '--verbose', is_flag=True, help='Verbose output')
 @click.version_option(version='0.1.0')
-def main(input_file, output_base, include_null_geometry, verbose):
+def main(input_file, output_base, include_null_geometry, workers, engine, verbose):
     """
     Convert KMZ/KML files to ESRI Shapefile format.
 
@@ -43,16 +58,25 @@ def main(input_file, output_base, include_null_geometry, verbose):
         \b
         # Include features with null geometry
         kmz2shapefile input.kmz --include-null-geometry
+
+        \b
+        # Parse a large file with 4 processes (-j 0 uses all cores)
+        kmz2shapefile input.kmz -j 4
+
+        \b
+        # Write with the columnar pyogrio backend (pip install kmz2shapefile[fast])
+        kmz2shapefile input.kmz --engine pyogrio
     """
     try:
-        converter = KMZConverter()
+        converter = KMZConverter(engine=engine)
 
         # Convert
         created_files = converter.convert(
             input_path=input_file,
             output_path=output_base,
             verbose=verbose,
-            skip_null_geometry=not include_null_geometry
+            skip_null_geometry=not include_null_geometry,
+            workers=workers
         )
 
         # Report results
@@ -79,4 +103,6 @@ def main(input_file, output_base, include_null_geometry, verbose):
 
 
 if __name__ == '__main__':
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
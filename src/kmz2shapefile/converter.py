@@ -1,50 +1,251 @@
 """Main orchestrator for KMZ to Shapefile conversion."""
 
+import collections
+import io
+import itertools
+import mmap
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
 
 from .kmz_extractor import KMZExtractor
-from .kml_parser import KMLParser, Placemark
-from .html_parser import HTMLTableParser
-from .geometry import GeometryConverter
+from .kml_parser import KMLParser, KMLStream, Placemark
+from .html_parser import HTML_PARSER_OPTIONS, HTMLTableParser
+from .geometry import GeometryConverter, ParsedGeometry
 from .shapefile_builder import ShapefileBuilder, Feature
 from .exceptions import ConversionError
 
 
+# (parsed geometry, properties, name) for one placemark, before Shapely build
+PlacemarkRecord = Tuple[Optional[ParsedGeometry], Dict[str, Any], str]
+
+# (parsed geometry, description, ExtendedData properties, name) for one
+# placemark whose description table has not been parsed yet
+PendingPlacemark = Tuple[Optional[ParsedGeometry], Optional[str], Dict[str, Any], str]
+
+# Placemark serialized for a worker process:
+# (geometry XML, description, ExtendedData XML, name)
+SerializedPlacemark = Tuple[Optional[bytes], Optional[str], Optional[bytes], str]
+
+
+def _parse_placemark(
+    geometry_converter: GeometryConverter,
+    html_parser: HTMLTableParser,
+    placemark: Placemark,
+    skip_null_geometry: bool
+) -> Optional[PendingPlacemark]:
+    """
+    Parse the XML-backed parts (geometry, ExtendedData) of one Placemark.
+
+    Must run while the placemark's elements are still current in the stream.
+
+    Args:
+        geometry_converter: Converter used to parse geometry elements
+        html_parser: Parser used for ExtendedData
+        placemark: Placemark to parse
+        skip_null_geometry: Drop placemarks whose geometry cannot be parsed
+
+    Returns:
+        Pending placemark, or None if it is dropped
+    """
+    parsed = geometry_converter.parse(placemark.geometry_element)
+
+    if parsed is None and skip_null_geometry:
+        return None
+
+    extended_props = (
+        html_parser.parse_extended_data(placemark.extended_data)
+        if placemark.extended_data is not None else {}
+    )
+
+    return parsed, placemark.description, extended_props, placemark.name
+
+
+def _merge_attributes(
+    html_parser: HTMLTableParser,
+    pending: List[PendingPlacemark]
+) -> List[PlacemarkRecord]:
+    """
+    Parse description tables in batches and merge them with ExtendedData.
+
+    Args:
+        html_parser: Parser used for descriptions
+        pending: Placemarks from _parse_placemark()
+
+    Returns:
+        Records aligned with ``pending``
+    """
+    attributes = html_parser.parse_attributes_batch(
+        [description for _, description, _, _ in pending]
+    )
+
+    records = []
+    for properties, (parsed, _, extended_props, name) in zip(attributes, pending):
+        # ExtendedData values take precedence over the description table
+        properties.update(extended_props)
+        records.append((parsed, properties, name))
+
+    return records
+
+
+def _placemarks_to_records(
+    geometry_converter: GeometryConverter,
+    html_parser: HTMLTableParser,
+    placemarks: Iterable[Placemark],
+    skip_null_geometry: bool
+) -> Tuple[List[PlacemarkRecord], int]:
+    """
+    Parse coordinates and attributes of Placemarks into records.
+
+    Used for inputs already in memory and by the worker processes.
+
+    Args:
+        geometry_converter: Converter used to parse geometry elements
+        html_parser: Parser used for descriptions and ExtendedData
+        placemarks: Iterable of placemarks (may be a stream)
+        skip_null_geometry: Drop placemarks whose geometry cannot be parsed
+
+    Returns:
+        Tuple of (records, number of placemarks consumed)
+    """
+    pending = []
+    placemark_count = 0
+
+    # Parse coordinates and ExtendedData while the stream is read
+    for placemark in placemarks:
+        placemark_count += 1
+
+        item = _parse_placemark(geometry_converter, html_parser, placemark, skip_null_geometry)
+        if item is not None:
+            pending.append(item)
+
+    return _merge_attributes(html_parser, pending), placemark_count
+
+
+def _serialize_placemark(placemark: Placemark) -> SerializedPlacemark:
+    """Serialize a Placemark's XML parts so it can be sent to a worker process."""
+    geometry = placemark.geometry_element
+    extended_data = placemark.extended_data
+    return (
+        etree.tostring(geometry) if geometry is not None else None,
+        placemark.description,
+        etree.tostring(extended_data) if extended_data is not None else None,
+        placemark.name,
+    )
+
+
+# Per-process parsers, created once by _init_worker()
+_worker_parsers: Dict[str, Any] = {}
+
+
+def _init_worker():
+    """Create the parsers used by a worker process."""
+    _worker_parsers['geometry'] = GeometryConverter()
+    _worker_parsers['html'] = HTMLTableParser()
+    # Reused for every serialized fragment; the fragments are lxml's own
+    # output, so no entity expansion or ID table is needed
+    _worker_parsers['xml'] = etree.XMLParser(
+        huge_tree=True, remove_blank_text=True, resolve_entities=False, collect_ids=False
+    )
+
+
+def _process_placemark_chunk(
+    chunk: List[SerializedPlacemark],
+    skip_null_geometry: bool
+) -> List[PlacemarkRecord]:
+    """
+    Worker entry point: rebuild Placemarks from XML and parse them to records.
+
+    Args:
+        chunk: Serialized placemarks
+        skip_null_geometry: Drop placemarks whose geometry cannot be parsed
+
+    Returns:
+        List of records for the chunk
+    """
+    xml_parser = _worker_parsers['xml']
+    placemarks = [
+        Placemark(
+            name=name,
+            description=description,
+            geometry_element=etree.fromstring(geometry, xml_parser) if geometry else None,
+            style_url=None,
+            extended_data=etree.fromstring(extended_data, xml_parser) if extended_data else None,
+        )
+        for geometry, description, extended_data, name in chunk
+    ]
+    records, _ = _placemarks_to_records(
+        _worker_parsers['geometry'], _worker_parsers['html'], placemarks, skip_null_geometry
+    )
+    return records
+
+
 class KMZConverter:
     """Main orchestrator for KMZ to Shapefile conversion."""
 
-    def __init__(self):
+    # With workers > 1, inputs with fewer placemarks than this are still
+    # processed sequentially, since process startup would outweigh the gain
+    PARALLEL_THRESHOLD = 1000
+
+    # Placemarks sent to a worker process per task
+    PARALLEL_CHUNK_SIZE = 256
+
+    # Parsed batches the sequential pipeline may hold before its XML stage
+    # waits for the description stage to catch up; per worker, the chunks
+    # the parallel path may have in flight
+    PIPELINE_DEPTH = 4
+
+    def __init__(self, recover: bool = False, engine: Optional[str] = None):
+        """
+        Args:
+            recover: Recover from malformed KML instead of failing
+            engine: Shapefile writer backend, 'fiona' (default) or 'pyogrio'
+        """
+        # Parsers are created once and reused for every file converted
+        self._html_parser_lxml = etree.HTMLParser(**HTML_PARSER_OPTIONS)
+
         self.extractor = KMZExtractor()
-        self.kml_parser = KMLParser()
-        self.html_parser = HTMLTableParser()
+        self.kml_parser = KMLParser(recover=recover)
+        self.html_parser = HTMLTableParser(self._html_parser_lxml)
         self.geometry_converter = GeometryConverter()
-        self.shapefile_builder = ShapefileBuilder()
+        self.shapefile_builder = ShapefileBuilder(engine)
 
     def convert(
         self,
         input_path: Path,
         output_path: Optional[Path] = None,
         verbose: bool = False,
-        skip_null_geometry: bool = True
+        skip_null_geometry: bool = True,
+        workers: int = 1
     ) -> List[Path]:
         """
         Convert KMZ/KML to Shapefile(s).
 
         Pipeline:
         1. Determine if input is KMZ or KML
-        2. Extract/read KML content
-        3. Parse KML to Placemarks
+        2. Open a stream over the KML content
+        3. Stream-parse KML to Placemarks
         4. Extract attributes from descriptions
         5. Convert geometries to Shapely
         6. Build Shapefile(s) split by geometry type
 
+        Placemarks are consumed one at a time as they are parsed, so the full
+        KML document is never held in memory.
+
         Args:
             input_path: Path to KMZ or KML file
             output_path: Optional output base path (without extension)
                         If None, uses input filename as base
             verbose: Print progress messages
             skip_null_geometry: Skip features without geometry
+            workers: Number of processes used to parse placemarks, and of
+                     threads used to write the per-type Shapefiles
+                     (1 = sequential, 0 = one per CPU core)
 
         Returns:
             List of created Shapefile paths
@@ -59,27 +260,28 @@ class KMZConverter:
         if output_path is None:
             output_path = input_path.with_suffix('')  # Remove extension
 
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
         if verbose:
             print(f"Reading: {input_path}")
 
-        # Step 1 & 2: Get KML content
-        kml_content = self._get_kml_content(input_path)
-
-        # Step 3: Parse KML to Placemarks
-        placemarks = self.kml_parser.parse(kml_content)
+        # Steps 1-5: Stream Placemarks from the KML and convert to features
+        with self._open_kml_stream(input_path) as kml_stream:
+            placemarks = self.kml_parser.iter_placemarks(kml_stream)
+            features, placemark_count = self._placemarks_to_features(
+                placemarks, skip_null_geometry, verbose, workers
+            )
 
         if verbose:
-            print(f"Found {len(placemarks)} placemark(s)")
+            print(f"Found {placemark_count} placemark(s)")
 
-        if not placemarks:
+        if not placemark_count:
             raise ConversionError(
                 f"No Placemarks found in {input_path}. "
                 f"The file may be empty or not contain valid KML features."
             )
 
-        # Step 4 & 5: Convert placemarks to features
-        features = self._placemarks_to_features(placemarks, skip_null_geometry, verbose)
-
         if not features:
             raise ConversionError(
                 "No features with valid geometry found. "
@@ -93,37 +295,39 @@ class KMZConverter:
         created_files = self.shapefile_builder.build_shapefiles(
             features,
             output_path,
-            verbose=verbose
+            verbose=verbose,
+            workers=workers
         )
 
         return created_files
 
-    def _get_kml_content(self, input_path: Path) -> str:
+    def _open_kml_stream(self, input_path: Path) -> KMLStream:
         """
-        Get KML content from KMZ or KML file.
+        Open a binary stream over the KML content of a KMZ or KML file.
 
         Args:
             input_path: Path to input file
 
         Returns:
-            KML content as string
+            Readable binary stream of KML content (caller must close it); plain
+            KML files are memory-mapped
 
         Raises:
-            ConversionError: If reading fails
+            ConversionError: If opening fails
         """
         # Check if file is KMZ (ZIP) or KML (XML)
         if self._is_kmz(input_path):
-            # Extract from KMZ
-            return self.extractor.extract_kml(input_path)
+            # Stream the KML entry out of the archive
+            return self.extractor.open_kml_stream(input_path)
         else:
-            # Read KML directly
+            # Read KML directly; lxml handles the declared encoding
             try:
-                return input_path.read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                raise ConversionError(
-                    f"Failed to read {input_path} as UTF-8. "
-                    f"Ensure the file is a valid KML file."
-                )
+                with input_path.open('rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        # Empty files cannot be mapped
+                        return io.BytesIO()
+                    # Serve reads from the page cache without a userspace file buffer
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             except Exception as e:
                 raise ConversionError(f"Failed to read {input_path}: {e}")
 
@@ -145,6 +349,14 @@ class KMZConverter:
 
         # Check by file signature (magic bytes) - ZIP files start with PK
         try:
+            if hasattr(os, 'pread'):
+                # Raw descriptor read avoids building a buffered file object
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    return os.pread(fd, 2, 0) == b'PK'
+                finally:
+                    os.close(fd)
+
             with open(path, 'rb') as f:
                 return f.read(2) == b'PK'
         except Exception:
@@ -152,47 +364,208 @@ class KMZConverter:
 
     def _placemarks_to_features(
         self,
-        placemarks: List[Placemark],
+        placemarks: Iterable[Placemark],
         skip_null_geometry: bool,
-        verbose: bool
-    ) -> List[Feature]:
+        verbose: bool,
+        workers: int = 1
+    ) -> Tuple[List[Feature], int]:
         """
         Convert Placemarks to Feature objects.
 
+        Coordinates and attributes are parsed first (optionally across worker
+        processes), then all Shapely geometries are built in bulk.
+
         Args:
-            placemarks: List of parsed placemarks
+            placemarks: Iterable of parsed placemarks (may be a stream)
             skip_null_geometry: Skip features without geometry
             verbose: Print warnings for skipped features
+            workers: Number of processes used to parse placemarks
 
         Returns:
-            List of Feature objects
+            Tuple of (list of Feature objects, number of placemarks consumed)
         """
-        features = []
-        skipped_count = 0
+        if workers > 1:
+            records, placemark_count = self._placemarks_to_records_parallel(
+                placemarks, skip_null_geometry, workers
+            )
+        else:
+            records, placemark_count = self._placemarks_to_records_pipelined(
+                placemarks, skip_null_geometry
+            )
 
-        for placemark in placemarks:
-            # Convert geometry
-            geometry = self.geometry_converter.convert(placemark.geometry_element)
+        # Build all Shapely geometries in bulk
+        geometries = self.geometry_converter.build([parsed for parsed, _, _ in records])
 
+        features = []
+        for geometry, (_, properties, name) in zip(geometries, records):
             if geometry is None and skip_null_geometry:
-                skipped_count += 1
                 continue
 
-            # Extract properties from HTML description
-            properties = self.html_parser.parse_attributes(placemark.description)
-
-            # Also extract from ExtendedData if present
-            extended_props = self.html_parser.parse_extended_data(placemark.extended_data)
-            properties.update(extended_props)
-
-            feature = Feature(
+            features.append(Feature(
                 geometry=geometry,
                 properties=properties,
-                name=placemark.name
-            )
-            features.append(feature)
+                name=name
+            ))
 
+        skipped_count = placemark_count - len(features) if skip_null_geometry else 0
         if verbose and skipped_count > 0:
             print(f"Skipped {skipped_count} feature(s) with null geometry")
 
-        return features
+        return features, placemark_count
+
+    def _placemarks_to_records_pipelined(
+        self,
+        placemarks: Iterable[Placemark],
+        skip_null_geometry: bool
+    ) -> Tuple[List[PlacemarkRecord], int]:
+        """
+        Parse Placemarks to records with XML and HTML parsing overlapped.
+
+        A background thread streams the KML and parses geometry and
+        ExtendedData, handing batches of placemarks to the calling thread,
+        which parses their description tables. lxml releases the GIL while
+        parsing, so the two stages run partly in parallel. All XML elements
+        stay on the background thread; only plain data crosses over.
+
+        At most PIPELINE_DEPTH batches wait between the stages. If the
+        calling thread fails, the background thread stops at its next
+        batch instead of parsing the rest of the file.
+
+        Args:
+            placemarks: Iterable of parsed placemarks (may be a stream)
+            skip_null_geometry: Drop placemarks whose geometry cannot be parsed
+
+        Returns:
+            Tuple of (records, number of placemarks consumed)
+        """
+        batch_size = self.html_parser.BATCH_SIZE
+        batches: 'queue.Queue[Optional[List[PendingPlacemark]]]' = queue.Queue(
+            maxsize=self.PIPELINE_DEPTH
+        )
+        # Set when the calling thread stops consuming batches
+        stopped = threading.Event()
+
+        def put(batch: Optional[List[PendingPlacemark]]) -> bool:
+            """Hand a batch over; False if the consumer has stopped."""
+            while not stopped.is_set():
+                try:
+                    batches.put(batch, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> int:
+            placemark_count = 0
+            batch: List[PendingPlacemark] = []
+            try:
+                for placemark in placemarks:
+                    placemark_count += 1
+                    item = _parse_placemark(
+                        self.geometry_converter, self.html_parser, placemark, skip_null_geometry
+                    )
+                    if item is None:
+                        continue
+                    batch.append(item)
+                    if len(batch) >= batch_size:
+                        if not put(batch):
+                            return placemark_count
+                        batch = []
+                if batch:
+                    put(batch)
+            finally:
+                # End marker, also sent when parsing fails
+                put(None)
+            return placemark_count
+
+        records: List[PlacemarkRecord] = []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            producer = executor.submit(produce)
+            try:
+                for batch in iter(batches.get, None):
+                    records.extend(_merge_attributes(self.html_parser, batch))
+            finally:
+                # Lets the producer exit early if merging failed
+                stopped.set()
+
+            # Re-raises parse errors from the producer thread
+            placemark_count = producer.result()
+
+        return records, placemark_count
+
+    def _placemarks_to_records_parallel(
+        self,
+        placemarks: Iterable[Placemark],
+        skip_null_geometry: bool,
+        workers: int
+    ) -> Tuple[List[PlacemarkRecord], int]:
+        """
+        Parse Placemarks to records in a pool of worker processes.
+
+        Placemarks are serialized to XML in chunks as they are streamed and
+        results are merged back in document order. At most workers *
+        PIPELINE_DEPTH chunks are in flight, so the document is never held
+        in memory as serialized chunks all at once. Small inputs (fewer than
+        PARALLEL_THRESHOLD placemarks) are handled sequentially.
+
+        Args:
+            placemarks: Iterable of parsed placemarks (may be a stream)
+            skip_null_geometry: Drop placemarks whose geometry cannot be parsed
+            workers: Number of worker processes
+
+        Returns:
+            Tuple of (records, number of placemarks consumed)
+        """
+        iterator = iter(placemarks)
+        head = list(itertools.islice(iterator, self.PARALLEL_THRESHOLD))
+
+        if len(head) < self.PARALLEL_THRESHOLD:
+            return _placemarks_to_records(
+                self.geometry_converter, self.html_parser, head, skip_null_geometry
+            )
+
+        chunks = self._serialized_chunks(itertools.chain(head, iterator))
+        records: List[PlacemarkRecord] = []
+        placemark_count = 0
+
+        max_in_flight = workers * self.PIPELINE_DEPTH
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures: Deque['Future[List[PlacemarkRecord]]'] = collections.deque()
+            for chunk in chunks:
+                placemark_count += len(chunk)
+                futures.append(
+                    executor.submit(_process_placemark_chunk, chunk, skip_null_geometry)
+                )
+                # Wait for the oldest chunk before serializing more
+                if len(futures) >= max_in_flight:
+                    records.extend(futures.popleft().result())
+
+            for future in futures:
+                records.extend(future.result())
+
+        return records, placemark_count
+
+    def _serialized_chunks(
+        self,
+        placemarks: Iterable[Placemark]
+    ) -> Iterator[List[SerializedPlacemark]]:
+        """
+        Serialize streamed Placemarks into chunks for worker processes.
+
+        Args:
+            placemarks: Iterable of parsed placemarks
+
+        Yields:
+            Lists of at most PARALLEL_CHUNK_SIZE serialized placemarks
+        """
+        chunk = []
+        for placemark in placemarks:
+            chunk.append(_serialize_placemark(placemark))
+            if len(chunk) >= self.PARALLEL_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
@@ -1,7 +1,12 @@
 """Map field names to valid Shapefile field names (max 10 characters)."""
 
 import re
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set
+
+
+# Runs of characters not allowed in DBF field names
+_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_]+')
 
 
 class FieldMapper:
@@ -17,6 +22,10 @@ class FieldMapper:
     def __init__(self):
         self._mapping: Dict[str, str] = {}
         self._used_names: Set[str] = set()
+        # Next collision suffix to try per base name
+        self._next_suffix: Dict[str, int] = {}
+        # Reverse mapping, built on first request after each map_field_names()
+        self._reverse: Optional[Dict[str, str]] = None
 
     def map_field_names(self, original_names: List[str]) -> Dict[str, str]:
         """
@@ -30,6 +39,8 @@ class FieldMapper:
         """
         self._mapping = {}
         self._used_names = set()
+        self._next_suffix = {}
+        self._reverse = None
 
         for name in original_names:
             mapped_name = self._create_unique_name(name)
@@ -88,13 +99,16 @@ class FieldMapper:
             Cleaned field name
         """
         # Replace invalid characters with underscore, collapse multiple underscores
-        cleaned = re.sub(r'[^a-zA-Z0-9_]+', '_', name)
+        cleaned = _INVALID_CHARS.sub('_', name)
         return cleaned.strip('_')
 
     def _resolve_collision(self, base_name: str) -> str:
         """
         Resolve field name collision by appending incrementing number.
 
+        Probing resumes from the last suffix handed out for the same base, so
+        many fields colliding on one prefix do not rescan from _1 each time.
+
         Examples:
             'longfieldna' with collision -> 'longfiel_1'
             'longfiel_1' with collision -> 'longfiel_2'
@@ -105,7 +119,7 @@ class FieldMapper:
         Returns:
             Unique field name with number suffix
         """
-        counter = 1
+        counter = self._next_suffix.get(base_name, 1)
 
         while True:
             suffix = f"_{counter}"
@@ -116,6 +130,7 @@ class FieldMapper:
             new_name = base_name[:max_base_len] + suffix
 
             if new_name not in self._used_names:
+                self._next_suffix[base_name] = counter + 1
                 return new_name
 
             counter += 1
@@ -124,20 +139,27 @@ class FieldMapper:
             if counter > 9999:
                 raise ValueError(f"Unable to create unique name for '{base_name}'")
 
-    def get_mapping(self) -> Dict[str, str]:
+    def get_mapping(self) -> Mapping[str, str]:
         """
         Get the current field name mapping.
 
+        Returns a read-only view rather than a copy; call ``.copy()`` on the
+        result to get a mutable dict.
+
         Returns:
-            Dictionary mapping original names to Shapefile names
+            Read-only mapping of original names to Shapefile names
         """
-        return self._mapping.copy()
+        return MappingProxyType(self._mapping)
 
-    def get_reverse_mapping(self) -> Dict[str, str]:
+    def get_reverse_mapping(self) -> Mapping[str, str]:
         """
         Get reverse mapping from Shapefile names to original names.
 
+        The reverse mapping is cached until the next map_field_names() call.
+
         Returns:
-            Dictionary mapping Shapefile names to original names
+            Read-only mapping of Shapefile names to original names
         """
-        return {v: k for k, v in self._mapping.items()}
+        if self._reverse is None:
+            self._reverse = {v: k for k, v in self._mapping.items()}
+        return MappingProxyType(self._reverse)
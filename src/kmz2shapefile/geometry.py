@@ -1,33 +1,144 @@
 """Convert KML geometry to Shapely geometry."""
 
-from typing import List, Optional, Tuple
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import shapely
 from lxml import etree
+from shapely import GeometryType
 from shapely.geometry import (
-    Point,
-    LineString,
-    Polygon,
-    MultiPoint,
-    MultiLineString,
-    MultiPolygon,
-    GeometryCollection,
+    GeometryCollection, LinearRing, LineString, MultiLineString, MultiPoint, MultiPolygon,
+    Point, Polygon
 )
 from shapely.geometry.base import BaseGeometry
 
-from .exceptions import GeometryConversionError
+from ._compat import DATACLASS_SLOTS
+
+
+KML_NS = 'http://www.opengis.net/kml/2.2'
+
+# Namespaced child tags in Clark notation, resolved once instead of per lookup
+_KML_PREFIX = f'{{{KML_NS}}}'
+_KML_TAGS = {
+    tag: _KML_PREFIX + tag
+    for tag in ('coordinates', 'outerBoundaryIs', 'LinearRing')
+}
+
+# Returned by _parse_coordinates when no valid coordinates are found
+_NO_COORDINATES = np.empty((0, 2), dtype=np.float64)
+_NO_COORDINATES.flags.writeable = False
+
+# Shapefile base type for each Shapely geometry type; anything else is a
+# GeometryCollection that has to be expanded
+_BASE_GEOMETRY_TYPES = {
+    'Point': 'Point',
+    'MultiPoint': 'Point',
+    'LineString': 'LineString',
+    'LinearRing': 'LineString',
+    'MultiLineString': 'LineString',
+    'Polygon': 'Polygon',
+    'MultiPolygon': 'Polygon',
+}
+
+# The same classification by geometry class, checked before reading geom_type
+_BASE_GEOMETRY_TYPES_BY_CLASS = {
+    Point: 'Point',
+    MultiPoint: 'Point',
+    LineString: 'LineString',
+    LinearRing: 'LineString',
+    MultiLineString: 'LineString',
+    Polygon: 'Polygon',
+    MultiPolygon: 'Polygon',
+    GeometryCollection: 'GeometryCollection',
+}
+
+# The same classification by shapely.get_type_id() value, for whole arrays
+_BASE_GEOMETRY_TYPES_BY_ID = {
+    int(GeometryType[name.upper()]): base_type
+    for name, base_type in _BASE_GEOMETRY_TYPES.items()
+}
+
+# Turns "lon,lat,alt" tuples into whitespace-separated values for one split()
+_COMMA_TO_SPACE = str.maketrans(',', ' ')
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ParsedGeometry:
+    """
+    Coordinates of a KML geometry, parsed but not yet built into Shapely.
+
+    The layout of ``coords`` depends on ``kind``:
+    - Point, LineString, MultiPoint: (N, 2) array
+    - Polygon: list of ring arrays (shell first, then holes)
+    - MultiLineString: list of line arrays
+    - MultiPolygon: list of polygons, each a list of ring arrays
+    - GeometryCollection: list of child ParsedGeometry objects
+    """
+    kind: str
+    coords: Any
 
 
 class GeometryConverter:
-    """Convert KML geometry elements to Shapely geometry objects."""
+    """
+    Convert KML geometry elements to Shapely geometry objects.
+
+    Conversion happens in two phases so many geometries can be built at once:
+    ``parse`` reads coordinates out of the XML into NumPy arrays, and ``build``
+    turns a whole list of parsed geometries into Shapely objects with one
+    ``shapely.from_ragged_array`` call per geometry type.
+    """
 
     NAMESPACES = {
-        'kml': 'http://www.opengis.net/kml/2.2',
+        'kml': KML_NS,
         'gx': 'http://www.google.com/kml/ext/2.2'
     }
 
+    # Parse method for each supported KML geometry tag
+    _PARSERS = {
+        'Point': '_parse_point',
+        'LineString': '_parse_linestring',
+        'Polygon': '_parse_polygon',
+        'MultiGeometry': '_parse_multigeometry',
+        # LinearRing is like LineString
+        'LinearRing': '_parse_linestring',
+    }
+
+    # Shapely geometry type and offset nesting depth for each parsed kind
+    RAGGED_TYPES: Dict[str, Tuple[GeometryType, int]] = {
+        'Point': (GeometryType.POINT, 0),
+        'LineString': (GeometryType.LINESTRING, 1),
+        'Polygon': (GeometryType.POLYGON, 2),
+        'MultiPoint': (GeometryType.MULTIPOINT, 1),
+        'MultiLineString': (GeometryType.MULTILINESTRING, 2),
+        'MultiPolygon': (GeometryType.MULTIPOLYGON, 3),
+    }
+
+    # KML elements that describe a geometry
+    GEOMETRY_TAGS = ('Point', 'LineString', 'Polygon', 'MultiGeometry', 'LinearRing')
+
+    def __init__(self):
+        # Compiled once; local-name() matches namespaced and bare KML in one pass
+        self._inner_boundary_xp = etree.XPath('./*[local-name()="innerBoundaryIs"]')
+        self._ring_coords_xp = etree.XPath(
+            './*[local-name()="LinearRing"]/*[local-name()="coordinates"]'
+        )
+        self._member_xp = etree.XPath(
+            './*[' + ' or '.join(f'local-name()="{tag}"' for tag in self.GEOMETRY_TAGS) + ']'
+        )
+
     def _find_element(self, parent: etree._Element, tag: str) -> Optional[etree._Element]:
-        """Find child element by tag, trying namespaced first then unnamespaced."""
-        elem = parent.find(f'kml:{tag}', namespaces=self.NAMESPACES)
-        return elem if elem is not None else parent.find(tag)
+        """
+        Find child element by tag, trying namespaced first then unnamespaced.
+
+        Children of a KML-namespaced parent are namespaced too, so the
+        unnamespaced lookup is only tried for non-namespaced documents.
+        """
+        elem = parent.find(_KML_TAGS[tag])
+        if elem is not None or parent.tag.startswith(_KML_PREFIX):
+            return elem
+        return parent.find(tag)
 
     def convert(self, geometry_element: Optional[etree._Element]) -> Optional[BaseGeometry]:
         """
@@ -46,64 +157,268 @@ class GeometryConverter:
         Returns:
             Shapely geometry object or None if conversion fails
         """
+        return self.build([self.parse(geometry_element)])[0]
+
+    def convert_batch(
+        self,
+        geometry_elements: Iterable[Optional[etree._Element]]
+    ) -> List[Optional[BaseGeometry]]:
+        """
+        Convert many KML geometry elements to Shapely geometries at once.
+
+        Args:
+            geometry_elements: KML geometry XML elements (None entries allowed)
+
+        Returns:
+            List of Shapely geometries (None where conversion failed),
+            aligned with the input
+        """
+        return self.build([self.parse(elem) for elem in geometry_elements])
+
+    def parse(self, geometry_element: Optional[etree._Element]) -> Optional[ParsedGeometry]:
+        """
+        Parse a KML geometry element into coordinate arrays.
+
+        Args:
+            geometry_element: KML geometry XML element
+
+        Returns:
+            ParsedGeometry or None if the element is missing, unsupported
+            or has invalid coordinates
+        """
         if geometry_element is None:
             return None
 
         # Get tag name without namespace
         tag = geometry_element.tag
-        if '}' in tag:
-            tag = tag.split('}')[1]
+        if not isinstance(tag, str):
+            # Comments and processing instructions
+            return None
+
+        method = self._PARSERS.get(tag.rpartition('}')[2])
+        if method is None:
+            # Unsupported geometry type
+            return None
+
+        parse: Callable[[etree._Element], Optional[ParsedGeometry]] = getattr(self, method)
 
         try:
-            if tag == 'Point':
-                return self._convert_point(geometry_element)
-            elif tag == 'LineString':
-                return self._convert_linestring(geometry_element)
-            elif tag == 'Polygon':
-                return self._convert_polygon(geometry_element)
-            elif tag == 'MultiGeometry':
-                return self._convert_multigeometry(geometry_element)
-            elif tag == 'LinearRing':
-                # LinearRing is like LineString
-                return self._convert_linestring(geometry_element)
-            else:
-                # Unsupported geometry type
-                return None
+            return parse(geometry_element)
 
         except Exception:
-            # If conversion fails, return None (graceful degradation)
+            # Invalid coordinates are reported by None returns; this only
+            # guards against unexpected errors (graceful degradation)
             return None
 
-    def _parse_coordinates(self, coord_text: str) -> List[Tuple[float, float]]:
+    def build(self, parsed: Sequence[Optional[ParsedGeometry]]) -> List[Optional[BaseGeometry]]:
         """
-        Parse KML coordinate string to list of (lon, lat) tuples.
+        Build Shapely geometries from parsed coordinates in bulk.
+
+        All geometries of the same kind are created by a single
+        ``shapely.from_ragged_array`` call. GeometryCollections are assembled
+        afterwards from their (also batch-built) members.
+
+        Args:
+            parsed: Parsed geometries (None entries allowed)
+
+        Returns:
+            List of Shapely geometries aligned with ``parsed``; None for None
+            inputs or geometries that could not be built
+        """
+        result: List[Optional[BaseGeometry]] = [None] * len(parsed)
+
+        indices_by_kind: Dict[str, List[int]] = {}
+        items_by_kind: Dict[str, List[ParsedGeometry]] = {}
+        for i, item in enumerate(parsed):
+            if item is not None:
+                indices_by_kind.setdefault(item.kind, []).append(i)
+                items_by_kind.setdefault(item.kind, []).append(item)
+
+        for kind, indices in indices_by_kind.items():
+            items = items_by_kind[kind]
+
+            if kind == 'GeometryCollection':
+                geometries = self._build_collections(items)
+            else:
+                geometries = self._build_ragged(kind, items)
+
+            for i, geometry in zip(indices, geometries):
+                result[i] = geometry
+
+        return result
+
+    def _build_ragged(
+        self,
+        kind: str,
+        items: List[ParsedGeometry]
+    ) -> List[Optional[BaseGeometry]]:
+        """
+        Build geometries of one kind with a single ragged-array call.
+
+        Falls back to building each geometry on its own if the batch fails,
+        so one bad geometry does not take the rest down with it.
+
+        Args:
+            kind: Parsed geometry kind shared by all items
+            items: Parsed geometries of that kind
+
+        Returns:
+            List of Shapely geometries (None where building failed)
+        """
+        geometry_type, depth = self.RAGGED_TYPES[kind]
+
+        try:
+            coords, offsets = self._to_ragged([item.coords for item in items], depth)
+            return list(shapely.from_ragged_array(geometry_type, coords, offsets))
+        except Exception:
+            if len(items) == 1:
+                return [None]
+            return [self._build_ragged(kind, [item])[0] for item in items]
+
+    def _build_collections(self, items: List[ParsedGeometry]) -> List[BaseGeometry]:
+        """
+        Build GeometryCollections, batch-building all their members together.
+
+        Args:
+            items: Parsed GeometryCollections
+
+        Returns:
+            List of Shapely GeometryCollections
+        """
+        members = [member for item in items for member in item.coords]
+        built = self.build(members)
+
+        collections = []
+        start = 0
+        for item in items:
+            end = start + len(item.coords)
+            collections.append(
+                GeometryCollection([g for g in built[start:end] if g is not None])
+            )
+            start = end
+
+        return collections
+
+    @staticmethod
+    def _to_ragged(
+        items: List[Any],
+        depth: int
+    ) -> Tuple[np.ndarray, Optional[Tuple[np.ndarray, ...]]]:
+        """
+        Flatten nested coordinate arrays into Shapely's ragged-array layout.
+
+        Args:
+            items: One nested coordinate structure per geometry
+            depth: Number of list levels above the coordinate arrays
+                   (0 for points, 1 for lines, 2 for polygons, ...)
+
+        Returns:
+            Tuple of (stacked (N, 2) coordinates, offsets from innermost to
+            outermost level, or None for points)
+        """
+        if depth == 0:
+            return np.concatenate(items), None
+
+        offsets = []
+        for level in range(depth):
+            # Offsets start at 0 and end at the total part count
+            level_offsets = np.zeros(len(items) + 1, dtype=np.int64)
+            np.cumsum(
+                np.fromiter(map(len, items), dtype=np.int64, count=len(items)),
+                out=level_offsets[1:]
+            )
+            offsets.append(level_offsets)
+            if level < depth - 1:
+                items = [part for item in items for part in item]
+
+        return np.concatenate(items), tuple(reversed(offsets))
+
+    def _parse_coordinates(self, coord_text: str) -> np.ndarray:
+        """
+        Parse KML coordinate string to an (N, 2) array of (lon, lat) rows.
 
         Note: Shapefile format only supports 2D coordinates, so altitude is dropped.
 
         KML format: "lon,lat,alt lon,lat,alt ..."
-        Output format: [(lon, lat), (lon, lat), ...]
+        Output format: array([[lon, lat], [lon, lat], ...])
+
+        A single tuple is parsed directly. Well-formed coordinate strings
+        (every tuple with the same number of values) are tokenized in a single
+        NumPy call. Anything else falls back to a per-tuple parse that skips
+        invalid tuples.
 
         Args:
             coord_text: KML coordinate string
 
         Returns:
-            List of (lon, lat) coordinate tuples
-
-        Raises:
-            GeometryConversionError: If coordinate parsing fails
+            C-contiguous float64 array of shape (N, 2); empty (N = 0) if no
+            valid coordinates are found
         """
         if not coord_text:
-            raise GeometryConversionError("Empty coordinate string")
+            return _NO_COORDINATES
+
+        text = coord_text.strip()
+        if not text:
+            return _NO_COORDINATES
+
+        tuples = text.split(None, 1)
+        if len(tuples) == 1:
+            # A single tuple (every Point): NumPy's setup cost outweighs
+            # parsing two floats directly
+            parts = text.split(',')
+            if len(parts) >= 2:
+                try:
+                    return np.array([[float(parts[0]), float(parts[1])]])
+                except ValueError:
+                    pass
+            return _NO_COORDINATES
+
+        # Values per tuple, taken from the first tuple (2 = lon,lat; 3 = lon,lat,alt)
+        ncols = tuples[0].count(',') + 1
+        tuples = text.split()
+
+        # Totals (comma parity, value count) cannot rule out mixed tuple
+        # lengths that happen to add up, so every tuple's commas are counted
+        if ncols >= 2 and set(map(str.count, tuples, repeat(','))) == {ncols - 1}:
+            try:
+                flat = np.fromstring(text.replace(',', ' '), sep=' ')
+            except ValueError:
+                # NumPy's reader rejects some spellings float() accepts (e.g. "1_000");
+                # a flat split keeps the regular layout without per-tuple work
+                try:
+                    flat = np.array(list(map(float, text.translate(_COMMA_TO_SPACE).split())))
+                except ValueError:
+                    flat = None
+
+            # Every tuple must have produced exactly ncols values
+            if flat is not None and flat.size == len(tuples) * ncols:
+                coordinates = flat.reshape(-1, ncols)
+                if ncols == 2:
+                    return coordinates
+                # Copy out (lon, lat) so the altitude column is not kept alive
+                # while all parsed geometries wait for the bulk build
+                return np.ascontiguousarray(coordinates[:, :2])
+
+        return self._parse_coordinates_fallback(text)
+
+    def _parse_coordinates_fallback(self, coord_text: str) -> np.ndarray:
+        """
+        Parse coordinate tuples one at a time, skipping invalid ones.
 
-        coordinates = []
+        Used for irregular coordinate strings (mixed 2D/3D tuples, stray
+        tokens) that the vectorized path cannot handle.
 
-        # Split by whitespace to get individual coordinate tuples
-        coord_tuples = coord_text.strip().split()
+        Args:
+            coord_text: KML coordinate string
 
-        for coord_tuple in coord_tuples:
-            if not coord_tuple:
-                continue
+        Returns:
+            float64 array of shape (N, 2); empty if no tuple is valid
+        """
+        # Flat (lon, lat) buffer; avoids a tuple per coordinate
+        coordinates = array('d')
 
+        # Split by whitespace to get individual coordinate tuples
+        for coord_tuple in coord_text.split():
             # Split by comma to get lon, lat, alt
             parts = coord_tuple.split(',')
 
@@ -112,59 +427,88 @@ class GeometryConverter:
                 continue
 
             try:
+                # Altitude is ignored for Shapefile (2D only)
                 lon = float(parts[0])
                 lat = float(parts[1])
-                # Altitude is ignored for Shapefile (2D only)
-
-                coordinates.append((lon, lat))
-            except (ValueError, IndexError):
+            except ValueError:
                 # Skip invalid coordinates
                 continue
+            coordinates.append(lon)
+            coordinates.append(lat)
 
         if not coordinates:
-            raise GeometryConversionError("No valid coordinates found")
+            return _NO_COORDINATES
+
+        return np.frombuffer(coordinates, dtype=np.float64).reshape(-1, 2)
+
+    def _parse_ring(self, coord_text: str) -> Optional[np.ndarray]:
+        """
+        Parse a LinearRing coordinate string, closing the ring if needed.
+
+        Args:
+            coord_text: KML coordinate string
+
+        Returns:
+            Closed ring coordinates as an (N, 2) array with N >= 4, or None
+            if the ring has fewer than 3 distinct coordinates
+        """
+        ring = self._parse_coordinates(coord_text)
+        if not len(ring):
+            return None
+
+        if not np.array_equal(ring[0], ring[-1]):
+            ring = np.vstack([ring, ring[:1]])
+
+        if len(ring) < 4:
+            return None
 
-        return coordinates
+        return ring
 
-    def _convert_point(self, element: etree._Element) -> Point:
+    def _parse_point(self, element: etree._Element) -> Optional[ParsedGeometry]:
         """
-        Convert Point to Shapely Point.
+        Parse Point coordinates.
 
         Args:
             element: Point XML element
 
         Returns:
-            Shapely Point geometry
+            ParsedGeometry of kind 'Point', or None if there are no valid
+            coordinates
         """
         coord_elem = self._find_element(element, 'coordinates')
         if coord_elem is None or not coord_elem.text:
-            raise GeometryConversionError("Point has no coordinates")
+            return None
 
         coordinates = self._parse_coordinates(coord_elem.text)
-        if not coordinates:
-            raise GeometryConversionError("Point has invalid coordinates")
+        if not len(coordinates):
+            return None
 
-        return Point(coordinates[0])
+        return ParsedGeometry('Point', coordinates[:1])
 
-    def _convert_linestring(self, element: etree._Element) -> LineString:
+    def _parse_linestring(self, element: etree._Element) -> Optional[ParsedGeometry]:
         """
-        Convert LineString to Shapely LineString.
+        Parse LineString (or LinearRing) coordinates.
 
         Args:
             element: LineString XML element
 
         Returns:
-            Shapely LineString geometry
+            ParsedGeometry of kind 'LineString', or None if there are fewer
+            than 2 valid coordinates
         """
         coord_elem = self._find_element(element, 'coordinates')
         if coord_elem is None or not coord_elem.text:
-            raise GeometryConversionError("LineString has no coordinates")
+            return None
 
-        return LineString(self._parse_coordinates(coord_elem.text))
+        coordinates = self._parse_coordinates(coord_elem.text)
+        if len(coordinates) < 2:
+            return None
 
-    def _convert_polygon(self, element: etree._Element) -> Polygon:
+        return ParsedGeometry('LineString', coordinates)
+
+    def _parse_polygon(self, element: etree._Element) -> Optional[ParsedGeometry]:
         """
-        Convert Polygon to Shapely Polygon.
+        Parse Polygon rings.
 
         Handles outer boundary and inner boundaries (holes).
 
@@ -172,83 +516,76 @@ class GeometryConverter:
             element: Polygon XML element
 
         Returns:
-            Shapely Polygon geometry
+            ParsedGeometry of kind 'Polygon', or None if the outer boundary
+            is missing or any ring is invalid
         """
         outer_boundary = self._find_element(element, 'outerBoundaryIs')
         if outer_boundary is None:
-            raise GeometryConversionError("Polygon has no outer boundary")
+            return None
 
         linear_ring = self._find_element(outer_boundary, 'LinearRing')
         if linear_ring is None:
-            raise GeometryConversionError("Outer boundary has no LinearRing")
+            return None
 
         coord_elem = self._find_element(linear_ring, 'coordinates')
         if coord_elem is None or not coord_elem.text:
-            raise GeometryConversionError("Polygon has no coordinates")
+            return None
 
-        outer_coords = self._parse_coordinates(coord_elem.text)
+        shell = self._parse_ring(coord_elem.text)
+        if shell is None:
+            return None
 
-        # Find inner boundaries (holes)
-        holes = []
-        inner_boundaries = element.findall('kml:innerBoundaryIs', namespaces=self.NAMESPACES)
-        if not inner_boundaries:
-            inner_boundaries = element.findall('innerBoundaryIs')
+        rings = [shell]
 
-        for inner_boundary in inner_boundaries:
-            linear_ring = self._find_element(inner_boundary, 'LinearRing')
-            if linear_ring is not None:
-                coord_elem = self._find_element(linear_ring, 'coordinates')
-                if coord_elem is not None and coord_elem.text:
-                    holes.append(self._parse_coordinates(coord_elem.text))
+        # Find inner boundaries (holes)
+        for inner_boundary in self._inner_boundary_xp(element):
+            ring_coords = self._ring_coords_xp(inner_boundary)
+            if ring_coords and ring_coords[0].text:
+                hole = self._parse_ring(ring_coords[0].text)
+                if hole is None:
+                    return None
+                rings.append(hole)
 
-        return Polygon(outer_coords, holes) if holes else Polygon(outer_coords)
+        return ParsedGeometry('Polygon', rings)
 
-    def _convert_multigeometry(self, element: etree._Element) -> BaseGeometry:
+    def _parse_multigeometry(self, element: etree._Element) -> Optional[ParsedGeometry]:
         """
-        Convert MultiGeometry to appropriate Shapely type.
+        Parse MultiGeometry members.
 
-        If all child geometries are the same type, converts to Multi* format
-        (MultiPoint, MultiLineString, MultiPolygon). Otherwise, returns
+        If all child geometries are the same type, yields a Multi* kind
+        (MultiPoint, MultiLineString, MultiPolygon). Otherwise, yields a
         GeometryCollection.
 
         Args:
             element: MultiGeometry XML element
 
         Returns:
-            Shapely Multi* geometry or GeometryCollection
-        """
-        geometries = []
-        geometry_types = set()
-
-        # Get all child elements
-        for child in element:
-            # Skip non-geometry children
-            tag = child.tag
-            if '}' in tag:
-                tag = tag.split('}')[1]
-
-            if tag in ['Point', 'LineString', 'Polygon', 'MultiGeometry', 'LinearRing']:
-                geom = self.convert(child)
-                if geom is not None:
-                    geometries.append(geom)
-                    geometry_types.add(geom.geom_type)
-
-        if not geometries:
-            raise GeometryConversionError("MultiGeometry has no valid geometries")
-
-        # If all geometries are the same type, convert to Multi* format
-        if len(geometry_types) == 1:
-            geom_type = list(geometry_types)[0]
-
-            if geom_type == 'LineString':
-                return MultiLineString(geometries)
-            elif geom_type == 'Point':
-                return MultiPoint(geometries)
-            elif geom_type == 'Polygon':
-                return MultiPolygon(geometries)
+            ParsedGeometry of a Multi* kind or 'GeometryCollection', or None
+            if no member is valid
+        """
+        members = []
+
+        # Geometry children only (other elements and comments are skipped)
+        for child in self._member_xp(element):
+            member = self.parse(child)
+            if member is not None:
+                members.append(member)
+
+        if not members:
+            return None
+
+        # If all geometries are the same simple type, use the Multi* format
+        kinds = {member.kind for member in members}
+        if len(kinds) == 1:
+            kind = kinds.pop()
+
+            if kind == 'Point':
+                return ParsedGeometry('MultiPoint', np.concatenate([m.coords for m in members]))
+            elif kind in ('LineString', 'Polygon'):
+                return ParsedGeometry(f'Multi{kind}', [m.coords for m in members])
 
         # Mixed types or nested collections - use GeometryCollection
-        return GeometryCollection(geometries)
+        return ParsedGeometry('GeometryCollection', members)
 
     @staticmethod
     def get_geometry_type(geometry: BaseGeometry) -> str:
@@ -267,13 +604,31 @@ class GeometryConverter:
         Returns:
             Base geometry type string
         """
-        geom_type = geometry.geom_type
+        base_type = _BASE_GEOMETRY_TYPES_BY_CLASS.get(type(geometry))
+        if base_type is None:
+            # Subclass or unexpected type: classify by its reported type name
+            base_type = _BASE_GEOMETRY_TYPES.get(geometry.geom_type, 'GeometryCollection')
+        return base_type
 
-        if geom_type in ('Point', 'MultiPoint'):
-            return 'Point'
-        elif geom_type in ('LineString', 'LinearRing', 'MultiLineString'):
-            return 'LineString'
-        elif geom_type in ('Polygon', 'MultiPolygon'):
-            return 'Polygon'
-        else:
-            return 'GeometryCollection'
+    @staticmethod
+    def get_geometry_types(geometries: Sequence[Optional[BaseGeometry]]) -> List[Optional[str]]:
+        """
+        Get the base geometry type of many geometries at once.
+
+        Classifies like get_geometry_type(), reading all type ids in one
+        vectorized call.
+
+        Args:
+            geometries: Shapely geometries; None entries are allowed
+
+        Returns:
+            Base geometry type strings, None where the geometry is None
+        """
+        array = np.empty(len(geometries), dtype=object)
+        array[:] = geometries
+        type_ids = shapely.get_type_id(array).tolist()
+
+        return [
+            None if type_id < 0 else _BASE_GEOMETRY_TYPES_BY_ID.get(type_id, 'GeometryCollection')
+            for type_id in type_ids
+        ]
@@ -1,18 +1,93 @@
 """Tkinter GUI for KMZ to Shapefile converter."""
 
+import json
+import multiprocessing
+import sys
 import tkinter as tk
+from multiprocessing.connection import Connection, wait
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import threading
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from kmz2shapefile.converter import KMZConverter
 from kmz2shapefile.exceptions import ConversionError
 
 
+# Remembers the last directories used in the file dialogs between sessions
+SETTINGS_PATH = Path.home() / ".kmz2shapefile.json"
+
+
+def _load_settings() -> Dict[str, str]:
+    """Load GUI settings, returning an empty dict if unavailable."""
+    try:
+        with open(SETTINGS_PATH, encoding='utf-8') as f:
+            settings = json.load(f)
+        return settings if isinstance(settings, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_settings(settings: Dict[str, str]):
+    """Save GUI settings, ignoring write failures."""
+    try:
+        with open(SETTINGS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(settings, f)
+    except Exception:
+        pass
+
+
+def _conversion_worker(
+    input_path: Path,
+    output_path: Path,
+    verbose: bool,
+    skip_null_geometry: bool,
+    sender: Connection
+):
+    """
+    Conversion process entry point.
+
+    Sends ('ok', [paths]), ('error', message) for conversion errors or
+    ('unexpected', message) for anything else back through the pipe.
+    """
+    try:
+        converter = KMZConverter()
+
+        if verbose:
+            print(f"Converting: {input_path}")
+            print(f"Output base: {output_path}")
+            print(f"Skip null: {skip_null_geometry}")
+
+        # This process is daemonic (so it never outlives the GUI), and daemonic
+        # processes may not start children, so parsing stays in-process
+        result = converter.convert(
+            input_path=input_path,
+            output_path=output_path,
+            verbose=verbose,
+            skip_null_geometry=skip_null_geometry,
+            workers=1,
+        )
+
+        if verbose:
+            print(f"Created {len(result)} Shapefile(s)")
+
+        sender.send(('ok', [str(f) for f in result]))
+
+    except ConversionError as e:
+        sender.send(('error', str(e)))
+    except Exception as e:
+        sender.send(('unexpected', str(e)))
+    finally:
+        sender.close()
+
+
 class KMZ2ShapefileApp:
     """Main GUI application for KMZ to Shapefile conversion."""
 
+    # Virtual event announcing the end of a conversion where Tk cannot watch
+    # the result pipe itself
+    CONVERSION_DONE_EVENT = '<<ConversionDone>>'
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("KMZ to Shapefile Converter")
@@ -22,17 +97,24 @@ class KMZ2ShapefileApp:
         # State
         self.input_path: Optional[Path] = None
         self.output_path: Optional[Path] = None
-        self.conversion_thread: Optional[threading.Thread] = None
+        self.conversion_process: Optional[multiprocessing.Process] = None
+        self._receiver: Optional[Connection] = None
         self.is_converting = False
         self.result: Optional[List[Path]] = None
         self.conversion_error: Optional[Exception] = None
 
+        # Last directories used in the file dialogs
+        settings = _load_settings()
+        self._last_input_dir: Optional[str] = settings.get('last_input_dir')
+        self._last_output_dir: Optional[str] = settings.get('last_output_dir')
+
         # Tkinter variables
         self.skip_null_var = tk.BooleanVar(value=True)
         self.verbose_var = tk.BooleanVar(value=False)
 
         self._create_widgets()
         self._configure_grid()
+        self.root.bind(self.CONVERSION_DONE_EVENT, lambda event: self._finish_conversion())
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -118,9 +200,12 @@ class KMZ2ShapefileApp:
                 ("KML files", "*.kml"),
                 ("All files", "*.*"),
             ],
+            initialdir=self._last_input_dir,
         )
         if filepath:
             self.input_path = Path(filepath)
+            self._last_input_dir = str(self.input_path.parent)
+            self._save_last_dirs()
             self.input_entry.config(state="normal")
             self.input_entry.delete(0, tk.END)
             self.input_entry.insert(0, filepath)
@@ -134,10 +219,10 @@ class KMZ2ShapefileApp:
     def _browse_output(self):
         """Open file dialog for output base selection."""
         initial_name = "output"
-        initial_dir = None
+        initial_dir = self._last_output_dir
         if self.input_path:
             initial_name = self.input_path.stem
-            initial_dir = str(self.input_path.parent)
+            initial_dir = initial_dir or str(self.input_path.parent)
 
         filepath = filedialog.asksaveasfilename(
             title="Select output base name",
@@ -150,6 +235,15 @@ class KMZ2ShapefileApp:
             if output_base.suffix:
                 output_base = output_base.with_suffix('')
             self._set_output_path(output_base)
+            self._last_output_dir = str(output_base.parent)
+            self._save_last_dirs()
+
+    def _save_last_dirs(self):
+        """Persist the last-used dialog directories."""
+        _save_settings({
+            'last_input_dir': self._last_input_dir,
+            'last_output_dir': self._last_output_dir,
+        })
 
     def _set_output_path(self, path: Path):
         """Set the output path and update display."""
@@ -169,7 +263,7 @@ class KMZ2ShapefileApp:
         self.verbose_check.config(state=state)
 
     def _start_conversion(self):
-        """Start conversion in background thread."""
+        """Start conversion in a background process."""
         if self.is_converting:
             return
 
@@ -190,47 +284,84 @@ class KMZ2ShapefileApp:
         self.result = None
         self.conversion_error = None
 
-        # Create and start worker thread
-        self.conversion_thread = threading.Thread(
-            target=self._conversion_worker, daemon=True
+        # Convert in a separate process so parsing does not compete with the
+        # Tk mainloop for the GIL
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self.conversion_process = multiprocessing.Process(
+            target=_conversion_worker,
+            args=(
+                self.input_path,
+                self.output_path,
+                self.verbose_var.get(),
+                self.skip_null_var.get(),
+                sender,
+            ),
+            daemon=True,
         )
-        self.conversion_thread.start()
+        self.conversion_process.start()
+        # The child holds its own copy of the sending end
+        sender.close()
+
+        self._receiver = receiver
+        self._watch_conversion(self.conversion_process, receiver)
+
+    def _watch_conversion(self, process: multiprocessing.Process, receiver: Connection):
+        """
+        Arrange for _finish_conversion() to run once the conversion ends.
+
+        The result pipe becomes readable when the process reports back or
+        exits (its end of the pipe is closed either way). On POSIX, Tk
+        watches the pipe itself and calls back on the main thread. Elsewhere
+        (Windows), a helper thread waits for the process and posts a virtual
+        event; tkinter hands calls from other threads to the mainloop thread
+        there, since Python's Windows builds use a threaded Tcl.
+        """
+        tk_app = self.root.tk
+        if hasattr(tk_app, 'createfilehandler'):
+            def on_readable(file: Connection, mask: int):
+                tk_app.deletefilehandler(receiver)
+                self._finish_conversion()
+
+            tk_app.createfilehandler(receiver, tk.READABLE, on_readable)
+            return
 
-        # Start polling for completion
-        self._poll_conversion()
+        def notify():
+            wait([receiver, process.sentinel])
+            try:
+                self.root.event_generate(self.CONVERSION_DONE_EVENT, when='tail')
+            except (RuntimeError, tk.TclError):
+                # The window was closed while converting
+                pass
+
+        threading.Thread(target=notify, daemon=True).start()
+
+    def _finish_conversion(self):
+        """Collect the conversion result on the main thread and update the UI."""
+        process = self.conversion_process
+        receiver = self._receiver
+        if process is None or receiver is None:
+            return
+        self._receiver = None
 
-    def _conversion_worker(self):
-        """Worker thread that performs the actual conversion."""
         try:
-            converter = KMZConverter()
-
-            if self.verbose_var.get():
-                print(f"Converting: {self.input_path}")
-                print(f"Output base: {self.output_path}")
-                print(f"Skip null: {self.skip_null_var.get()}")
-
-            self.result = converter.convert(
-                input_path=self.input_path,
-                output_path=self.output_path,
-                verbose=self.verbose_var.get(),
-                skip_null_geometry=self.skip_null_var.get(),
-            )
-
-            if self.verbose_var.get():
-                print(f"Created {len(self.result)} Shapefile(s)")
-
-        except ConversionError as e:
-            self.conversion_error = e
-        except Exception as e:
-            self.conversion_error = Exception(f"Unexpected error: {e}")
-
-    def _poll_conversion(self):
-        """Poll for conversion thread completion using after()."""
-        if self.conversion_thread and self.conversion_thread.is_alive():
-            # Check again in 100ms
-            self.root.after(100, self._poll_conversion)
-        else:
-            # Conversion finished
+            try:
+                status, payload = receiver.recv()
+            except EOFError:
+                # Exited without reporting back; join first to get its exit code
+                process.join()
+                status, payload = 'unexpected', (
+                    f"conversion process exited with code {process.exitcode}"
+                )
+            process.join()
+
+            if status == 'ok':
+                self.result = [Path(p) for p in payload]
+            elif status == 'error':
+                self.conversion_error = ConversionError(payload)
+            else:
+                self.conversion_error = Exception(f"Unexpected error: {payload}")
+        finally:
+            receiver.close()
             self._on_conversion_complete()
 
     def _on_conversion_complete(self):
@@ -254,12 +385,17 @@ class KMZ2ShapefileApp:
 
 def main():
     """Main entry point for GUI application."""
-    # Enable DPI awareness on Windows
-    try:
-        from ctypes import windll
-        windll.shcore.SetProcessDpiAwareness(1)
-    except Exception:
-        pass
+    # Needed for the conversion process in frozen (e.g. PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    # Enable DPI awareness on Windows (ctypes is not imported elsewhere)
+    if sys.platform == 'win32':
+        try:
+            from ctypes import windll
+            windll.shcore.SetProcessDpiAwareness(1)
+        except (ImportError, AttributeError, OSError):
+            # shcore is unavailable before Windows 8.1
+            pass
 
     root = tk.Tk()
 
@@ -1,18 +1,102 @@
 """Parse HTML tables from KML descriptions to extract attributes."""
 
-from typing import Any, Dict, Optional, Union
-from bs4 import BeautifulSoup
+import re
+from typing import Any, Dict, List, Optional, Sequence, Union
 from lxml import etree
 
 
-def _get_local_name(elem: etree._Element) -> Optional[str]:
-    """Get the local name of an XML element without namespace prefix."""
-    return etree.QName(elem.tag).localname if isinstance(elem.tag, str) else None
+# Any table markup (<table>, <tr>, <td>, <th>); descriptions without it have no rows
+_TABLE_MARKUP = re.compile(r'<t(?:able|[rdh])', re.IGNORECASE)
+
+# Tags that make libxml2 drop table rows a permissive HTML parser keeps:
+# content after </html> is discarded, and the others hold raw text, so rows
+# inside them are never parsed as markup. They are stripped before parsing.
+_ROW_HIDING_TAG_NAMES = (
+    'html', 'iframe', 'noembed', 'noframes', 'plaintext', 'select', 'textarea', 'title', 'xmp'
+)
+_ROW_HIDING_TAGS = re.compile(
+    rf'</?(?:{"|".join(_ROW_HIDING_TAG_NAMES)})\b[^>]*>', re.IGNORECASE
+)
+
+# Options for lxml HTML parsers reading descriptions: whitespace-only text,
+# comments and processing instructions are never table content, and no ID
+# table is needed
+HTML_PARSER_OPTIONS = {
+    'remove_blank_text': True,
+    'remove_comments': True,
+    'remove_pis': True,
+    'collect_ids': False,
+}
+
+# Cell values that _coerce_type() turns into numbers
+_INT_VALUE = re.compile(r'-?\d+')
+_FLOAT_VALUE = re.compile(r'[-+]?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def _unhide_rows(markup: str) -> str:
+    """
+    Strip tags that would hide table rows from libxml2's HTML parser.
+
+    The case-insensitive regex is much slower than plain substring checks,
+    so it only runs when one of the tag names occurs at all.
+    """
+    lowered = markup.lower()
+    if any(name in lowered for name in _ROW_HIDING_TAG_NAMES):
+        return _ROW_HIDING_TAGS.sub('', markup)
+    return markup
+
+
+def _has_table_markup(html_description: str) -> bool:
+    """Cheaply check whether a description can contain table rows at all."""
+    return _TABLE_MARKUP.search(html_description) is not None
+
+
+# ExtendedData fields in document order, matched in any namespace
+_DATA_FIELDS_XP = etree.XPath(
+    './/*[local-name()="SimpleData" or local-name()="Data"]'
+)
+_DATA_VALUE_XP = etree.XPath('*[local-name()="value"]')
+
+
+def _get_cell_text(cell: etree._Element) -> str:
+    """Get the text of a table cell, stripping each text fragment."""
+    if not len(cell):
+        # Plain-text cell (the common case): no descendant walk needed
+        text = cell.text
+        return text.strip() if text else ''
+    return ''.join(text.strip() for text in cell.itertext())
 
 
 class HTMLTableParser:
     """Extract attributes from HTML tables in KML descriptions."""
 
+    # Descriptions parsed per lxml call in parse_attributes_batch(). A malformed
+    # description only sends its own batch down the per-description path.
+    BATCH_SIZE = 256
+
+    # Wrapper element that keeps descriptions apart inside a batched document
+    _BATCH_TAG = 'kmzdesc'
+
+    # Distinct descriptions whose parsed attributes are remembered; the cache
+    # is emptied when it fills up
+    CACHE_SIZE = 4096
+
+    def __init__(self, lxml_parser: Optional[etree.HTMLParser] = None):
+        """
+        Args:
+            lxml_parser: HTML parser to reuse for all descriptions; a new one
+                         is created if not given
+        """
+        if lxml_parser is None:
+            lxml_parser = etree.HTMLParser(**HTML_PARSER_OPTIONS)
+        self._lxml_parser = lxml_parser
+        # One shared str per distinct attribute name; placemarks usually
+        # repeat the same columns, so their dicts all reuse these keys
+        self._key_cache: Dict[str, str] = {}
+        # Parsed attributes by description; many placemarks share one
+        # description template verbatim. Callers get copies, never these dicts.
+        self._description_cache: Dict[str, Dict[str, Any]] = {}
+
     def parse_attributes(self, html_description: Optional[str]) -> Dict[str, Any]:
         """
         Parse HTML table into key-value dictionary.
@@ -25,53 +109,180 @@ class HTMLTableParser:
 
         Returns:
             Dictionary of attributes {key: value}
-            Returns empty dict if no table found or description is None
+            Returns empty dict if no table found, description is None or
+            parsing fails
         """
-        if not html_description:
+        # Skip parser setup entirely for empty or prose-only descriptions
+        if not html_description or not _has_table_markup(html_description):
             return {}
 
+        attributes = self._description_cache.get(html_description)
+        if attributes is None:
+            attributes = self._parse_table_html(html_description)
+            self._cache_attributes(html_description, attributes)
+
+        return dict(attributes)
+
+    def parse_attributes_batch(
+        self,
+        html_descriptions: Sequence[Optional[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse HTML tables from many descriptions with few parser invocations.
+
+        Descriptions are wrapped in placeholder elements and parsed together
+        with lxml's HTML parser, so parser setup is paid once per batch rather
+        than once per description. If a description's markup leaks out of its
+        wrapper (e.g. an unclosed table), that batch is re-parsed one
+        description at a time.
+
+        Each distinct description is parsed only once; repeats, in this batch
+        or earlier ones, get a copy of the cached attributes.
+
+        Args:
+            html_descriptions: HTML strings from KML descriptions (None allowed)
+
+        Returns:
+            List of attribute dictionaries aligned with the input
+        """
+        cache = self._description_cache
+        results: List[Dict[str, Any]] = [{} for _ in html_descriptions]
+
+        # Indices of each description still to be parsed, in first-seen order
+        pending: Dict[str, List[int]] = {}
+        for i, desc in enumerate(html_descriptions):
+            if not desc or not _has_table_markup(desc):
+                continue
+            attributes = cache.get(desc)
+            if attributes is not None:
+                results[i] = dict(attributes)
+            else:
+                pending.setdefault(desc, []).append(i)
+
+        unique = list(pending)
+        for start in range(0, len(unique), self.BATCH_SIZE):
+            chunk = unique[start:start + self.BATCH_SIZE]
+            for desc, attributes in zip(chunk, self._parse_table_chunk(chunk)):
+                self._cache_attributes(desc, attributes)
+                for i in pending[desc]:
+                    results[i] = dict(attributes)
+
+        return results
+
+    def _cache_attributes(self, html_description: str, attributes: Dict[str, Any]):
+        """
+        Remember the parsed attributes of a description.
+
+        Args:
+            html_description: Parsed HTML string
+            attributes: Its attributes; must not be handed out to callers
+        """
+        cache = self._description_cache
+        if len(cache) >= self.CACHE_SIZE:
+            cache.clear()
+        cache[html_description] = attributes
+
+    def _parse_table_chunk(self, html_descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse a chunk of descriptions as one wrapped HTML document.
+
+        Args:
+            html_descriptions: Non-empty HTML strings
+
+        Returns:
+            List of attribute dictionaries aligned with the input
+        """
+        tag = self._BATCH_TAG
+        markup = ''.join(f'<{tag}>{desc}</{tag}>' for desc in html_descriptions)
+        markup = _unhide_rows(markup)
+
         try:
-            soup = BeautifulSoup(html_description, 'html.parser')
-
-            # Find all table rows
-            rows = soup.find_all('tr')
-            if not rows:
-                return {}
-
-            attributes = {}
-
-            for row in rows:
-                # Try to get key from <th> or first <td>
-                th = row.find('th')
-                tds = row.find_all('td')
-
-                if th and len(tds) == 1:
-                    # Format: <th>key</th><td>value</td>
-                    key = th.get_text(strip=True)
-                    value_text = tds[0].get_text(strip=True)
-                elif len(tds) == 2:
-                    # Format: <td>key</td><td>value</td>
-                    key = tds[0].get_text(strip=True)
-                    value_text = tds[1].get_text(strip=True)
-                else:
-                    continue
+            root = etree.fromstring(f'<body>{markup}</body>', self._lxml_parser)
+            wrappers = root.findall(f'body/{tag}')
+        except Exception:
+            wrappers = []
 
-                # Skip empty keys
-                if not key:
-                    continue
+        if len(wrappers) != len(html_descriptions):
+            # Markup escaped its wrapper; parse each description on its own
+            return [self._parse_table_html(desc) for desc in html_descriptions]
 
-                # Coerce value to appropriate type
-                value = self._coerce_type(value_text)
+        return [self._extract_table_rows(wrapper) for wrapper in wrappers]
 
-                attributes[key] = value
+    def _parse_table_html(self, html_description: str) -> Dict[str, Any]:
+        """
+        Parse a single description with lxml's HTML parser.
 
-            return attributes
+        Args:
+            html_description: HTML string from KML description
 
+        Returns:
+            Dictionary of attributes (empty if parsing fails)
+        """
+        try:
+            root = etree.fromstring(_unhide_rows(html_description), self._lxml_parser)
         except Exception:
-            # If HTML parsing fails for any reason, return empty dict
-            # This ensures graceful degradation
             return {}
 
+        return self._extract_table_rows(root) if root is not None else {}
+
+    def _extract_table_rows(self, root: etree._Element) -> Dict[str, Any]:
+        """
+        Extract key-value pairs from all table rows below an lxml element.
+
+        Handles the same row formats as parse_attributes():
+        <tr><td>key</td><td>value</td></tr> and <tr><th>key</th><td>value</td></tr>
+
+        Args:
+            root: Parsed HTML element
+
+        Returns:
+            Dictionary of attributes {key: value}
+        """
+        attributes = {}
+        # Hot-loop lookups bound to locals
+        key_cache = self._key_cache
+        coerce = self._coerce_type
+
+        for row in root.iter('tr'):
+            # One pass over the row's cells instead of separate th/td searches
+            th = None
+            tds = []
+            nested = False
+            for cell in row:
+                tag = cell.tag
+                if tag == 'td':
+                    tds.append(cell)
+                elif tag == 'th' and th is None:
+                    th = cell
+                else:
+                    continue
+                # Rows wrapping a nested table are layout, not attributes;
+                # the nested rows are visited on their own
+                if len(cell) and next(cell.iter('tr'), None) is not None:
+                    nested = True
+                    break
+
+            if nested:
+                continue
+
+            if th is not None and len(tds) == 1:
+                key = _get_cell_text(th)
+                value_text = _get_cell_text(tds[0])
+            elif len(tds) == 2:
+                key = _get_cell_text(tds[0])
+                value_text = _get_cell_text(tds[1])
+            else:
+                continue
+
+            # Skip empty keys
+            if not key:
+                continue
+
+            key = key_cache.setdefault(key, key)
+            attributes[key] = coerce(value_text)
+
+        return attributes
+
     def _coerce_type(self, value: str) -> Union[str, int, float, None]:
         """
         Attempt to convert string to appropriate type.
@@ -91,16 +302,23 @@ class HTMLTableParser:
         if not value or value == '<Null>':
             return None
 
-        # Check for int (no decimal point, only digits with optional leading minus)
-        if '.' not in value and value.lstrip('-').isdigit():
+        # Plain ASCII digits (the common numeric case): no regex needed
+        if value.isdigit() and value.isascii():
             return int(value)
 
-        # Check for float (has decimal point)
-        if '.' in value:
-            try:
-                return float(value)
-            except ValueError:
-                pass
+        # Neither pattern can match unless the value starts like a number;
+        # most text values are rejected here with one character check
+        first = value[0]
+        if not (first.isdigit() or first in '-+.'):
+            return value
+
+        # Int: only digits with optional leading minus
+        if _INT_VALUE.fullmatch(value):
+            return int(value)
+
+        # Float: must have a decimal point, optionally an exponent
+        if _FLOAT_VALUE.fullmatch(value):
+            return float(value)
 
         return value
 
@@ -123,23 +341,25 @@ class HTMLTableParser:
 
         attributes = {}
 
+        # Hot-loop lookups bound to locals
+        key_cache = self._key_cache
+        coerce = self._coerce_type
+
         try:
-            for elem in extended_data.iter():
-                local_name = _get_local_name(elem)
-
-                if local_name == 'SimpleData':
-                    name = elem.get('name')
-                    if name and elem.text:
-                        attributes[name] = self._coerce_type(elem.text.strip())
-
-                elif local_name == 'Data':
-                    name = elem.get('name')
-                    value_elem = next(
-                        (child for child in elem if _get_local_name(child) == 'value'),
-                        None
-                    )
-                    if name and value_elem is not None and value_elem.text:
-                        attributes[name] = self._coerce_type(value_elem.text.strip())
+            for elem in _DATA_FIELDS_XP(extended_data):
+                name = elem.get('name')
+                if not name:
+                    continue
+                name = key_cache.setdefault(name, name)
+
+                if elem.tag.endswith('SimpleData'):
+                    if elem.text:
+                        attributes[name] = coerce(elem.text.strip())
+
+                else:
+                    value_elems = _DATA_VALUE_XP(elem)
+                    if value_elems and value_elems[0].text:
+                        attributes[name] = coerce(value_elems[0].text.strip())
 
         except Exception:
             pass
@@ -1,13 +1,35 @@
 """Parse KML XML and extract Placemarks."""
 
+import io
+import mmap
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Union
 from lxml import etree
 
+from ._compat import DATACLASS_SLOTS
 from .exceptions import KMLParseError
 
 
-@dataclass
+KML_NS = 'http://www.opengis.net/kml/2.2'
+
+# Binary KML input accepted by iter_placemarks(): a file-like stream or a
+# memory-mapped KML file
+KMLStream = Union[IO[bytes], mmap.mmap]
+
+# Geometry children of a Placemark, in the order they are preferred
+_GEOMETRY_TAGS = ('MultiGeometry', 'LineString', 'Polygon', 'Point', 'LinearRing')
+
+# Placemark child tags, namespaced (Clark notation) and bare, mapped to their
+# local name so each child is classified with a single dict lookup
+_KML_PREFIX = f'{{{KML_NS}}}'
+_PLACEMARK_CHILDREN = {
+    prefix + tag: tag
+    for tag in ('name', 'description', 'styleUrl', 'ExtendedData') + _GEOMETRY_TAGS
+    for prefix in ('', _KML_PREFIX)
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Placemark:
     """Represents a KML Placemark."""
     name: str
@@ -21,21 +43,35 @@ class KMLParser:
     """Parse KML XML and extract Placemarks."""
 
     NAMESPACES = {
-        'kml': 'http://www.opengis.net/kml/2.2',
+        'kml': KML_NS,
         'gx': 'http://www.google.com/kml/ext/2.2'
     }
 
-    def _find_element(self, parent: etree._Element, tag: str) -> Optional[etree._Element]:
-        """Find child element by tag, trying namespaced first then unnamespaced."""
-        elem = parent.find(f'kml:{tag}', namespaces=self.NAMESPACES)
-        return elem if elem is not None else parent.find(tag)
-
-    def parse(self, kml_content: str) -> List[Placemark]:
+    def __init__(self, recover: bool = False):
+        """
+        Args:
+            recover: Let libxml2 recover from malformed XML (e.g. stray
+                     control bytes) instead of raising KMLParseError
+        """
+        # Parser options, set up once and reused for every document.
+        # Dropping whitespace-only text nodes, comments and processing
+        # instructions keeps the element trees small; KML declares no DTD
+        # entities, so entity expansion is switched off (also blocks XXE).
+        self._parser_options = {
+            'huge_tree': True,
+            'remove_blank_text': True,
+            'remove_comments': True,
+            'remove_pis': True,
+            'resolve_entities': False,
+            'recover': recover,
+        }
+
+    def parse(self, kml_content: Union[str, bytes]) -> List[Placemark]:
         """
         Parse KML and extract all Placemarks.
 
         Args:
-            kml_content: KML XML string
+            kml_content: KML XML string (or encoded bytes)
 
         Returns:
             List of Placemark objects
@@ -43,25 +79,53 @@ class KMLParser:
         Raises:
             KMLParseError: If XML parsing fails
         """
-        try:
-            root = etree.fromstring(kml_content.encode('utf-8'))
-        except etree.XMLSyntaxError as e:
-            raise KMLParseError(f"Invalid KML XML: {e}")
+        if isinstance(kml_content, str):
+            kml_content = kml_content.encode('utf-8')
 
-        # Find all Placemarks using XPath
-        placemarks = root.xpath('//kml:Placemark', namespaces=self.NAMESPACES)
+        return list(self.iter_placemarks(io.BytesIO(kml_content)))
 
-        if not placemarks:
-            # Try without namespace (some KML files may not use namespaces properly)
-            placemarks = root.xpath('//Placemark')
+    def iter_placemarks(self, source: KMLStream) -> Iterator[Placemark]:
+        """
+        Stream Placemarks from a KML source one at a time.
 
-        result = []
-        for placemark_elem in placemarks:
-            placemark = self._extract_placemark(placemark_elem)
-            if placemark:
-                result.append(placemark)
+        Uses incremental parsing so the full document tree is never built.
+        Each Placemark subtree, and every element preceding it, is freed once
+        the consumer moves on to the next one; elements still referenced by a
+        yielded Placemark (geometry, ExtendedData) remain valid.
 
-        return result
+        Both namespaced and non-namespaced Placemarks are matched.
+
+        Args:
+            source: Readable binary stream (or memory map) of KML XML
+
+        Yields:
+            Placemark objects in document order
+
+        Raises:
+            KMLParseError: If XML parsing fails
+        """
+        context = etree.iterparse(
+            source, events=('end',), tag='{*}Placemark', **self._parser_options
+        )
+
+        try:
+            for _, element in context:
+                placemark = self._extract_placemark(element)
+                if placemark:
+                    yield placemark
+
+                # Free the processed subtree and everything before it in the
+                # document, including finished Folders and Styles
+                element.clear(keep_tail=True)
+                node = element
+                parent = node.getparent()
+                while parent is not None:
+                    while node.getprevious() is not None:
+                        del parent[0]
+                    node, parent = parent, parent.getparent()
+
+        except etree.XMLSyntaxError as e:
+            raise KMLParseError(f"Invalid KML XML: {e}")
 
     def _extract_placemark(self, element: etree._Element) -> Optional[Placemark]:
         """
@@ -74,41 +138,66 @@ class KMLParser:
             Placemark object or None if extraction fails
         """
         try:
-            name_elem = self._find_element(element, 'name')
+            children = self._collect_children(element)
+
+            name_elem = children.get('name')
             name = name_elem.text if name_elem is not None and name_elem.text else "Unnamed"
 
-            desc_elem = self._find_element(element, 'description')
+            desc_elem = children.get('description')
             description = desc_elem.text if desc_elem is not None else None
 
-            style_elem = self._find_element(element, 'styleUrl')
+            style_elem = children.get('styleUrl')
             style_url = style_elem.text if style_elem is not None else None
 
             return Placemark(
                 name=name,
                 description=description,
-                geometry_element=self._extract_geometry_element(element),
+                geometry_element=self._extract_geometry_element(children),
                 style_url=style_url,
-                extended_data=self._find_element(element, 'ExtendedData')
+                extended_data=children.get('ExtendedData')
             )
 
         except Exception:
             # Graceful degradation: skip malformed placemarks
             return None
 
-    def _extract_geometry_element(self, placemark: etree._Element) -> Optional[etree._Element]:
+    def _collect_children(self, placemark: etree._Element) -> Dict[str, etree._Element]:
         """
-        Find geometry element in Placemark.
+        Find the Placemark children this parser reads in one pass.
 
-        Priority order: MultiGeometry, LineString, Polygon, Point, LinearRing
+        Namespaced and unnamespaced tags are both matched; the first child
+        with a given local name wins.
 
         Args:
             placemark: Placemark XML element
 
+        Returns:
+            Dictionary mapping local tag name to child element
+        """
+        children: Dict[str, etree._Element] = {}
+        for child in placemark:
+            local_name = _PLACEMARK_CHILDREN.get(child.tag)
+            if local_name is not None and local_name not in children:
+                children[local_name] = child
+        return children
+
+    def _extract_geometry_element(
+        self,
+        children: Dict[str, etree._Element]
+    ) -> Optional[etree._Element]:
+        """
+        Pick the geometry element among a Placemark's children.
+
+        Priority order: MultiGeometry, LineString, Polygon, Point, LinearRing
+
+        Args:
+            children: Placemark children from _collect_children()
+
         Returns:
             Geometry element or None if not found
         """
-        for geom_type in ('MultiGeometry', 'LineString', 'Polygon', 'Point', 'LinearRing'):
-            elem = self._find_element(placemark, geom_type)
+        for geom_type in _GEOMETRY_TAGS:
+            elem = children.get(geom_type)
             if elem is not None:
                 return elem
         return None
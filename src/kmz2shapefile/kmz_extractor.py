@@ -1,8 +1,9 @@
 """Extract KML content from KMZ archives."""
 
+import io
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import IO, List, Optional
 
 from .exceptions import KMZExtractionError
 
@@ -10,10 +11,18 @@ from .exceptions import KMZExtractionError
 class KMZExtractor:
     """Extract KML from KMZ archive (ZIP format)."""
 
+    # KML entries up to this size are decompressed in one read; larger ones
+    # are streamed so the whole document is never held in memory.
+    IN_MEMORY_LIMIT = 64 * 1024 * 1024
+
     def extract_kml(self, kmz_path: Path) -> str:
         """
         Extract doc.kml content from KMZ file.
 
+        Prefer open_kml_stream() for conversion: it lets the KML parser read
+        the entry incrementally and decode it in C, instead of holding the
+        document as both bytes and str.
+
         Args:
             kmz_path: Path to KMZ file
 
@@ -23,13 +32,43 @@ class KMZExtractor:
         Raises:
             KMZExtractionError: If extraction fails
         """
+        # Thin wrapper over open_kml_stream() for callers that want the text
+        with self.open_kml_stream(kmz_path) as stream:
+            try:
+                return stream.read().decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise KMZExtractionError(
+                    f"Failed to decode KML content as UTF-8: {e}"
+                )
+
+    def open_kml_stream(self, kmz_path: Path) -> IO[bytes]:
+        """
+        Open the KML entry of a KMZ file as a binary stream.
+
+        Entries smaller than IN_MEMORY_LIMIT are decompressed with a single
+        read and served from memory, which avoids the per-chunk overhead of
+        ZipFile's streaming reader. Larger entries are decompressed lazily as
+        they are read; the archive then stays open until the returned stream
+        is closed.
+
+        Args:
+            kmz_path: Path to KMZ file
+
+        Returns:
+            Readable binary stream of the KML content
+
+        Raises:
+            KMZExtractionError: If the archive or KML entry cannot be opened
+        """
         if not kmz_path.exists():
             raise KMZExtractionError(f"File not found: {kmz_path}")
 
         try:
             with zipfile.ZipFile(kmz_path, 'r') as kmz:
-                # Find doc.kml (case-insensitive)
-                kml_filename = self._find_kml_file(kmz.namelist())
+                # Ignore empty entries (e.g. directory markers)
+                kml_filename = self._find_kml_file(
+                    [info.filename for info in kmz.infolist() if info.file_size > 0]
+                )
 
                 if not kml_filename:
                     raise KMZExtractionError(
@@ -37,21 +76,19 @@ class KMZExtractor:
                         f"Available files: {', '.join(kmz.namelist())}"
                     )
 
-                # Extract and decode
-                kml_bytes = kmz.read(kml_filename)
-                return kml_bytes.decode('utf-8')
+                if kmz.getinfo(kml_filename).file_size < self.IN_MEMORY_LIMIT:
+                    return io.BytesIO(kmz.read(kml_filename))
+
+                # The member stream holds its own reference to the archive file
+                return kmz.open(kml_filename, 'r')
 
         except zipfile.BadZipFile:
             raise KMZExtractionError(
                 f"{kmz_path} is not a valid ZIP file. "
                 f"KMZ files must be ZIP archives containing KML."
             )
-        except UnicodeDecodeError as e:
-            raise KMZExtractionError(
-                f"Failed to decode KML content as UTF-8: {e}"
-            )
 
-    def _find_kml_file(self, filenames: list[str]) -> Optional[str]:
+    def _find_kml_file(self, filenames: List[str]) -> Optional[str]:
         """
         Find KML file in archive (case-insensitive).
 
@@ -63,8 +100,12 @@ class KMZExtractor:
         Returns:
             KML filename or None if not found
         """
-        # Try doc.kml first (most common), then fall back to any .kml file
-        return (
-            next((n for n in filenames if n.lower() == 'doc.kml'), None) or
-            next((n for n in filenames if n.lower().endswith('.kml')), None)
-        )
+        # doc.kml wins (most common); otherwise the first .kml file seen
+        fallback = None
+        for name in filenames:
+            lower = name.lower()
+            if lower == 'doc.kml':
+                return name
+            if fallback is None and lower.endswith('.kml'):
+                fallback = name
+        return fallback
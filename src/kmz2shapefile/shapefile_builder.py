@@ -1,23 +1,169 @@
 """Build and write Shapefile from features."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import itertools
 import fiona
+import numpy as np
+import shapely
 from fiona.crs import CRS
-from shapely.geometry import mapping
+from shapely.geometry import GeometryCollection, mapping
 from shapely.geometry.base import BaseGeometry
 
+from ._compat import DATACLASS_SLOTS
 from .field_mapper import FieldMapper
 from .geometry import GeometryConverter
 from .exceptions import ShapefileWriteError
 
+try:
+    # Optional columnar writer; fiona is used when it is not installed
+    from pyogrio import raw as pyogrio_raw
+except ImportError:
+    pyogrio_raw = None
+
 
 # WGS84 CRS definition
 WGS84_CRS = CRS.from_epsg(4326)
 
+# Shapefile writer backends
+ENGINES = ('fiona', 'pyogrio')
+
+# Geometry types fiona accepts in a layer of each schema type; the pyogrio
+# writer rejects the same ones so both engines fail alike
+_LAYER_GEOMETRY_TYPES = {
+    'Point': ('Point',),
+    'LineString': ('LineString', 'MultiLineString'),
+    'Polygon': ('Polygon', 'MultiPolygon'),
+}
+
+# DBF text encoding fiona writes by default (GDAL's LDID/87)
+_DBF_ENCODING = 'ISO-8859-1'
+
+# (original name, short name, value converter) for one Shapefile field
+FieldConverter = Tuple[str, str, Callable[[Any], Any]]
+
+
+def _to_str(value: Any) -> Optional[str]:
+    """Convert a value for a 'str' field."""
+    return None if value is None else str(value)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Convert a value for an 'int' field, None if it is not numeric."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert a value for a 'float' field, None if it is not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _identity(value: Any) -> Any:
+    """Pass a value through unchanged."""
+    return value
+
+
+def _to_dbf_text(value: str) -> str:
+    """Replace characters the DBF encoding cannot hold with '?', as GDAL does."""
+    return value.encode(_DBF_ENCODING, 'replace').decode(_DBF_ENCODING)
+
+
+def _coordinate_list(geom: BaseGeometry) -> List[List[float]]:
+    """Get a simple geometry's coordinates as nested lists, keeping Z if present."""
+    coordinates: List[List[float]] = shapely.get_coordinates(geom, include_z=geom.has_z).tolist()
+    return coordinates
+
+
+def _geometry_to_geojson(geom: BaseGeometry) -> Dict:
+    """
+    Convert a geometry to a GeoJSON-like dict for fiona.
+
+    Points read their coordinates directly; LineStrings and Polygons read
+    theirs as numpy arrays instead of walking them one tuple at a time
+    through mapping(); other types fall back to mapping().
+
+    Args:
+        geom: Shapely geometry
+
+    Returns:
+        GeoJSON-like geometry dictionary
+    """
+    geom_type = geom.geom_type
+
+    if not geom.is_empty:
+        if geom_type == 'Point':
+            # Direct coordinate access beats an array round trip for one vertex
+            if geom.has_z:
+                return {'type': 'Point', 'coordinates': [geom.x, geom.y, geom.z]}
+            return {'type': 'Point', 'coordinates': [geom.x, geom.y]}
+        if geom_type == 'LineString':
+            return {'type': 'LineString', 'coordinates': _coordinate_list(geom)}
+        if geom_type == 'Polygon':
+            rings = [_coordinate_list(geom.exterior)]
+            rings.extend(_coordinate_list(ring) for ring in geom.interiors)
+            return {'type': 'Polygon', 'coordinates': rings}
+
+    # Empty geometries and other types
+    geometry: Dict = mapping(geom)
+    return geometry
 
-@dataclass
+
+def _geometries_to_geojson(geometries: List[BaseGeometry]) -> List[Dict]:
+    """
+    Convert many geometries to GeoJSON-like dicts for fiona.
+
+    When every geometry is a non-empty Point, or every one a non-empty
+    LineString, with the same dimensionality, all coordinates are read with
+    a single shapely.get_coordinates() call and sliced per geometry. Other
+    mixes are converted one at a time with _geometry_to_geojson().
+
+    Args:
+        geometries: Shapely geometries
+
+    Returns:
+        GeoJSON-like geometry dictionaries, in input order
+    """
+    array = np.empty(len(geometries), dtype=object)
+    array[:] = geometries
+
+    type_ids = np.unique(shapely.get_type_id(array))
+    has_z = np.unique(shapely.has_z(array))
+
+    if (
+        len(type_ids) != 1
+        or type_ids[0] not in (shapely.GeometryType.POINT, shapely.GeometryType.LINESTRING)
+        or len(has_z) != 1
+        or shapely.is_empty(array).any()
+    ):
+        return [_geometry_to_geojson(geom) for geom in geometries]
+
+    coords = shapely.get_coordinates(array, include_z=bool(has_z[0])).tolist()
+
+    if type_ids[0] == shapely.GeometryType.POINT:
+        return [{'type': 'Point', 'coordinates': point} for point in coords]
+
+    ends = np.cumsum(shapely.get_num_coordinates(array)).tolist()
+    lines = []
+    start = 0
+    for end in ends:
+        lines.append({'type': 'LineString', 'coordinates': coords[start:end]})
+        start = end
+    return lines
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Feature:
     """Represents a feature with geometry and properties."""
     geometry: Optional[BaseGeometry]
@@ -25,17 +171,153 @@ class Feature:
     name: str
 
 
+# Maximum DBF string field width, and the longest value that still widens it
+# (fields get 10 characters of headroom)
+_MAX_STR_WIDTH = 254
+_MAX_STR_LEN = _MAX_STR_WIDTH - 10
+
+# Field value kind by exact type; one dict lookup instead of an isinstance()
+# chain for the common types
+_VALUE_KINDS = {bool: 'bool', int: 'int', float: 'float', str: 'str'}
+
+
+def _value_kind(value: Any) -> Optional[str]:
+    """
+    Classify a value whose exact type is not in _VALUE_KINDS.
+
+    Args:
+        value: Field value, e.g. a subclass or numpy scalar
+
+    Returns:
+        Value kind, or None for values that do not affect the field type
+    """
+    if isinstance(value, bool):
+        return 'bool'
+    elif isinstance(value, int):
+        return 'int'
+    elif isinstance(value, float):
+        return 'float'
+    elif isinstance(value, str):
+        return 'str'
+    return None
+
+
+class _FieldStats:
+    """Accumulates the kinds of values seen in one field to infer its type."""
+
+    __slots__ = ('has_int', 'has_float', 'has_str', 'max_str_len')
+
+    def __init__(self):
+        self.has_int = False
+        self.has_float = False
+        self.has_str = False
+        self.max_str_len = 80
+
+    def add(self, value: Any):
+        """Record one field value."""
+        if self.max_str_len >= _MAX_STR_LEN:
+            # Already a string field of the maximum width; nothing can change it
+            return
+
+        kind = _VALUE_KINDS.get(type(value))
+        if kind is None:
+            kind = _value_kind(value)
+            if kind is None:
+                return
+
+        if kind == 'str':
+            self.has_str = True
+            if len(value) > self.max_str_len:
+                self.max_str_len = len(value)
+        elif self.has_str:
+            # Once a string is seen the field is a string field, and other
+            # values are shorter than the minimum width
+            return
+        elif kind == 'int':
+            self.has_int = True
+        elif kind == 'float':
+            self.has_float = True
+        else:
+            self.has_str = True  # bool, written as 'True' or 'False'
+
+    def field_type(self) -> str:
+        """
+        Get the fiona field type for the values seen.
+
+        Returns:
+            Fiona field type string
+        """
+        # Determine type (string is most flexible)
+        if self.has_str:
+            return f'str:{min(self.max_str_len + 10, _MAX_STR_WIDTH)}'
+        elif self.has_float:
+            return 'float'
+        elif self.has_int:
+            return 'int'
+        else:
+            return 'str:80'
+
+
+def _write_group(
+    features: List[Feature],
+    output_path: Path,
+    geom_type: str,
+    engine: str,
+    sort_fields: bool
+):
+    """
+    Write one geometry type's Shapefile in a worker thread.
+
+    Each call uses its own ShapefileBuilder, so concurrent writes never share
+    FieldMapper state.
+
+    Args:
+        features: List of features (all same geometry type)
+        output_path: Output Shapefile path
+        geom_type: Geometry type for this file
+        engine: Shapefile writer backend
+        sort_fields: Order fields alphabetically
+    """
+    builder = ShapefileBuilder(engine, sort_fields=sort_fields)
+    builder._write_shapefile(features, output_path, geom_type)
+
+
 class ShapefileBuilder:
     """Build and write Shapefile from features."""
 
-    def __init__(self):
+    # Features whose geometries are converted together while writing records
+    GEOMETRY_BATCH_SIZE = 1024
+
+    def __init__(self, engine: Optional[str] = None, sort_fields: bool = True):
+        """
+        Args:
+            engine: Shapefile writer backend, 'fiona' (default) or 'pyogrio'.
+                    pyogrio writes whole columns at once and needs the
+                    optional pyogrio package; it is only used when asked for.
+            sort_fields: Order fields alphabetically. If False, fields keep
+                         the order they first appear in, with 'name' first,
+                         and no sort is needed.
+
+        Raises:
+            ValueError: If the engine is unknown or not installed
+        """
+        if engine is None:
+            engine = 'fiona'
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown Shapefile engine '{engine}', expected one of {ENGINES}")
+        if engine == 'pyogrio' and pyogrio_raw is None:
+            raise ValueError("The 'pyogrio' engine requires the pyogrio package")
+
+        self.engine = engine
+        self.sort_fields = sort_fields
         self.field_mapper = FieldMapper()
 
     def build_shapefiles(
         self,
         features: List[Feature],
         output_base: Path,
-        verbose: bool = False
+        verbose: bool = False,
+        workers: int = 1
     ) -> List[Path]:
         """
         Write features to Shapefile(s), split by geometry type.
@@ -46,6 +328,8 @@ class ShapefileBuilder:
                         e.g., '/path/to/output' creates
                         '/path/to/output_point.shp', etc.
             verbose: Print progress messages
+            workers: Number of threads used to write the per-type
+                     Shapefiles concurrently (1 = sequential)
 
         Returns:
             List of created Shapefile paths
@@ -59,14 +343,21 @@ class ShapefileBuilder:
         if not grouped:
             raise ShapefileWriteError("No features with valid geometry to write")
 
-        created_files = []
-
-        for geom_type, type_features in grouped.items():
-            output_path = self._get_output_path(output_base, geom_type)
+        outputs = [
+            (self._get_output_path(output_base, geom_type), geom_type, type_features)
+            for geom_type, type_features in grouped.items()
+        ]
 
-            if verbose:
+        if verbose:
+            for output_path, geom_type, type_features in outputs:
                 print(f"Writing {len(type_features)} {geom_type} features to {output_path}")
 
+        if workers > 1 and len(outputs) > 1:
+            return self._write_parallel(outputs, workers)
+
+        created_files = []
+
+        for output_path, geom_type, type_features in outputs:
             try:
                 self._write_shapefile(type_features, output_path, geom_type)
                 created_files.append(output_path)
@@ -77,6 +368,51 @@ class ShapefileBuilder:
 
         return created_files
 
+    def _write_parallel(
+        self,
+        outputs: List[Tuple[Path, str, List[Feature]]],
+        workers: int
+    ) -> List[Path]:
+        """
+        Write each geometry type's Shapefile in its own worker thread.
+
+        The outputs are independent files, so they can be written
+        concurrently; GDAL's file I/O overlaps between threads, and features
+        are shared in memory rather than pickled to other processes. Results
+        are collected in the original order.
+
+        Args:
+            outputs: (output path, geometry type, features) per Shapefile
+            workers: Maximum number of worker threads
+
+        Returns:
+            List of created Shapefile paths
+
+        Raises:
+            ShapefileWriteError: If writing fails
+        """
+        created_files = []
+
+        with ThreadPoolExecutor(max_workers=min(len(outputs), workers)) as executor:
+            futures = [
+                (output_path, executor.submit(
+                    _write_group, type_features, output_path, geom_type,
+                    self.engine, self.sort_fields
+                ))
+                for output_path, geom_type, type_features in outputs
+            ]
+
+            for output_path, future in futures:
+                try:
+                    future.result()
+                    created_files.append(output_path)
+                except Exception as e:
+                    raise ShapefileWriteError(
+                        f"Failed to write Shapefile {output_path}: {e}"
+                    )
+
+        return created_files
+
     def _group_by_geometry_type(
         self,
         features: List[Feature]
@@ -92,11 +428,14 @@ class ShapefileBuilder:
         """
         grouped: Dict[str, List[Feature]] = {}
 
-        for feature in features:
-            if feature.geometry is None:
-                continue
+        # Classify every geometry in one vectorized call
+        geom_types = GeometryConverter.get_geometry_types(
+            [feature.geometry for feature in features]
+        )
 
-            geom_type = GeometryConverter.get_geometry_type(feature.geometry)
+        for feature, geom_type in zip(features, geom_types):
+            if geom_type is None:
+                continue
 
             if geom_type == 'GeometryCollection':
                 # Expand GeometryCollection into individual geometries
@@ -114,35 +453,37 @@ class ShapefileBuilder:
         """
         Expand a GeometryCollection into individual features by geometry type.
 
+        Nested collections are flattened with an explicit stack, in document
+        order. The expanded features share the original properties dict,
+        which is never modified afterwards.
+
         Args:
             feature: Feature with GeometryCollection
             grouped: Dictionary to add expanded features to
         """
-        from shapely.geometry import GeometryCollection
-
         if not isinstance(feature.geometry, GeometryCollection):
             return
 
-        num_geoms = len(feature.geometry.geoms)
-        for i, geom in enumerate(feature.geometry.geoms):
-            geom_type = GeometryConverter.get_geometry_type(geom)
-            sub_name = f"{feature.name}_{i}" if num_geoms > 1 else feature.name
-
-            if geom_type == 'GeometryCollection':
-                # Recursively expand nested collections
-                sub_feature = Feature(
-                    geometry=geom,
-                    properties=feature.properties.copy(),
-                    name=sub_name
-                )
-                self._expand_geometry_collection(sub_feature, grouped)
+        properties = feature.properties
+        stack = [(feature.geometry, feature.name)]
+
+        while stack:
+            geom, name = stack.pop()
+
+            if isinstance(geom, GeometryCollection):
+                # Members pushed in reverse so they are popped in document order
+                members = geom.geoms
+                if len(members) > 1:
+                    stack.extend(
+                        (members[i], f"{name}_{i}") for i in range(len(members) - 1, -1, -1)
+                    )
+                else:
+                    stack.extend((member, name) for member in members)
             else:
-                new_feature = Feature(
-                    geometry=geom,
-                    properties=feature.properties.copy(),
-                    name=sub_name
+                geom_type = GeometryConverter.get_geometry_type(geom)
+                grouped.setdefault(geom_type, []).append(
+                    Feature(geometry=geom, properties=properties, name=name)
                 )
-                grouped.setdefault(geom_type, []).append(new_feature)
 
     def _get_output_path(self, output_base: Path, geom_type: str) -> Path:
         """
@@ -177,22 +518,31 @@ class ShapefileBuilder:
             output_path: Output Shapefile path
             geom_type: Geometry type for this file
         """
-        # Collect all property names
-        all_props = set()
-        for feature in features:
-            all_props.update(feature.properties.keys())
-            all_props.add('name')  # Always include name
+        # Collect all property names; 'name' is always included
+        if self.sort_fields:
+            all_props = set().union(*(feature.properties for feature in features))
+            all_props.add('name')
+            prop_list = sorted(all_props)
+        else:
+            # First-seen order, which follows the source KML's columns
+            prop_list = list(dict.fromkeys(itertools.chain(
+                ('name',), *(feature.properties for feature in features)
+            )))
 
         # Create field name mapping
-        prop_list = sorted(all_props)
         field_mapping = self.field_mapper.map_field_names(prop_list)
 
-        # Build schema
+        # Build schema, then pick each field's value converter once
         schema = self._build_schema(features, field_mapping, geom_type)
+        converters = self._field_converters(field_mapping, schema)
 
         # Create parent directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if self.engine == 'pyogrio':
+            self._write_pyogrio(features, output_path, schema, converters)
+            return
+
         # Write Shapefile
         with fiona.open(
             output_path,
@@ -201,145 +551,248 @@ class ShapefileBuilder:
             crs=WGS84_CRS,
             schema=schema
         ) as dst:
-            for feature in features:
-                record = self._feature_to_record(feature, field_mapping, schema)
-                dst.write(record)
+            # One writerecords() call; records are produced lazily as fiona
+            # consumes them, so only one is alive at a time
+            dst.writerecords(self._iter_records(features, converters))
 
-    def _build_schema(
+    def _write_pyogrio(
         self,
         features: List[Feature],
-        field_mapping: Dict[str, str],
-        geom_type: str
-    ) -> Dict:
+        output_path: Path,
+        schema: Dict,
+        converters: List[FieldConverter]
+    ):
         """
-        Build fiona schema for Shapefile.
+        Write features to a single Shapefile with pyogrio.
+
+        Attributes are gathered into one array per field and geometries into
+        one WKB array, so GDAL writes whole columns without building a record
+        dict per feature.
+
+        The output matches the fiona writer's: text is written in fiona's
+        ISO-8859-1 encoding, with characters it cannot hold replaced by '?'.
+        String fields are fixed-width arrays, from which pyogrio takes the
+        schema's DBF field widths. Geometries are written 2D, and geometry
+        types fiona rejects for the layer are rejected here too.
 
         Args:
-            features: List of features to analyze for field types
-            field_mapping: Original to truncated field name mapping
-            geom_type: Geometry type
+            features: List of features (all same geometry type)
+            output_path: Output Shapefile path
+            schema: Shapefile schema
+            converters: Field converters from _field_converters()
 
-        Returns:
-            Fiona schema dictionary
+        Raises:
+            ValueError: If a geometry does not fit the layer's geometry type
         """
-        properties = {
-            short_name: self._infer_field_type(features, original_name)
-            for original_name, short_name in field_mapping.items()
-        }
+        geometries = np.empty(len(features), dtype=object)
+        geometries[:] = [feature.geometry for feature in features]
+
+        geometry_type = schema['geometry']
+        allowed_types = _LAYER_GEOMETRY_TYPES[geometry_type]
+        for geom in geometries:
+            if geom.geom_type not in allowed_types:
+                raise ValueError(
+                    "Record's geometry type does not match collection schema's geometry "
+                    f"type: '{geom.geom_type}' != '{geometry_type}'"
+                )
 
-        return {
-            'geometry': geom_type,
-            'properties': properties
-        }
+        field_types = schema['properties']
+        columns = self._property_columns(features, converters)
+        fields = []
+        field_data = []
+        field_mask = []
+
+        for original_name, short_name, convert in converters:
+            values = list(map(convert, columns[original_name]))
+
+            field_type = field_types[short_name]
+            mask = None
+            if field_type == 'int':
+                mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+                data = np.array([0 if v is None else v for v in values], dtype=np.int64)
+            elif field_type == 'float':
+                # NaN is written as null
+                data = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            elif field_type.startswith('str:'):
+                mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+                width = field_type[4:]
+                data = np.array(
+                    ['' if v is None else _to_dbf_text(v) for v in values], dtype=f'<U{width}'
+                )
+            else:
+                data = np.empty(len(values), dtype=object)
+                data[:] = values
+
+            fields.append(short_name)
+            field_data.append(data)
+            field_mask.append(mask)
+
+        # Shapefile line and polygon layers hold multi-part shapes as they are;
+        # the layer type stays the schema's, as with fiona
+        pyogrio_raw.write(
+            str(output_path),
+            geometry=shapely.to_wkb(shapely.force_2d(geometries)),
+            field_data=field_data,
+            fields=fields,
+            field_mask=field_mask,
+            driver='ESRI Shapefile',
+            geometry_type=geometry_type,
+            crs='EPSG:4326',
+            encoding=_DBF_ENCODING,
+            promote_to_multi=False,
+        )
 
-    def _infer_field_type(
+    def _property_columns(
         self,
         features: List[Feature],
-        field_name: str
-    ) -> str:
+        converters: List[FieldConverter]
+    ) -> Dict[str, np.ndarray]:
         """
-        Infer fiona field type from feature values.
+        Pivot feature properties into one array per field.
+
+        Columns are allocated once at the feature count and filled in a single
+        pass over the features, visiting only the properties each one has;
+        missing values stay None.
 
         Args:
             features: List of features
-            field_name: Field name to check
+            converters: Field converters from _field_converters()
 
         Returns:
-            Fiona field type string
+            Dictionary mapping original field name to an object array of
+            unconverted values, in feature order
         """
-        has_int = False
-        has_float = False
-        has_str = False
-        max_str_len = 80
+        count = len(features)
+        columns = {
+            original_name: np.full(count, None, dtype=object)
+            for original_name, _, _ in converters
+        }
+        name_column = columns.get('name')
 
-        for feature in features:
-            if field_name == 'name':
-                value = feature.name
-            else:
-                value = feature.properties.get(field_name)
+        for i, feature in enumerate(features):
+            # The 'name' field always comes from the feature name
+            if name_column is not None:
+                name_column[i] = feature.name
 
-            if value is None:
-                continue
+            for original_name, value in feature.properties.items():
+                if original_name != 'name':
+                    column = columns.get(original_name)
+                    if column is not None:
+                        column[i] = value
 
-            if isinstance(value, bool):
-                has_str = True
-                max_str_len = max(max_str_len, 5)  # 'True' or 'False'
-            elif isinstance(value, int):
-                has_int = True
-            elif isinstance(value, float):
-                has_float = True
-            elif isinstance(value, str):
-                has_str = True
-                max_str_len = max(max_str_len, len(value))
+        return columns
 
-        # Determine type (string is most flexible)
-        if has_str:
-            return f'str:{min(max_str_len + 10, 254)}'
-        elif has_float:
-            return 'float'
-        elif has_int:
-            return 'int'
-        else:
-            return 'str:80'
+    def _iter_records(
+        self,
+        features: List[Feature],
+        converters: List[FieldConverter]
+    ) -> Iterator[Dict]:
+        """
+        Lazily convert features to fiona records.
+
+        Geometries are converted GEOMETRY_BATCH_SIZE at a time, so only one
+        batch of geometry dicts is alive at once.
+
+        Args:
+            features: Features to convert
+            converters: Field converters from _field_converters()
+
+        Yields:
+            Fiona record dictionaries
+        """
+        # (original name, short name, converter) per field, plus whether the
+        # field holds the Placemark name rather than a property
+        fields = tuple(
+            (original_name, short_name, convert, original_name == 'name')
+            for original_name, short_name, convert in converters
+        )
+        batch_size = self.GEOMETRY_BATCH_SIZE
+
+        for start in range(0, len(features), batch_size):
+            batch = features[start:start + batch_size]
+            geometries = _geometries_to_geojson([feature.geometry for feature in batch])
+            for feature, geometry in zip(batch, geometries):
+                name = feature.name
+                props = feature.properties
+                yield {
+                    'geometry': geometry,
+                    'properties': {
+                        short_name: convert(name if is_name else props.get(original_name))
+                        for original_name, short_name, convert, is_name in fields
+                    }
+                }
 
-    def _feature_to_record(
+    def _build_schema(
         self,
-        feature: Feature,
+        features: List[Feature],
         field_mapping: Dict[str, str],
-        schema: Dict
+        geom_type: str
     ) -> Dict:
         """
-        Convert feature to fiona record.
+        Build fiona schema for Shapefile.
 
         Args:
-            feature: Feature to convert
-            field_mapping: Field name mapping
-            schema: Shapefile schema
+            features: List of features to analyze for field types
+            field_mapping: Original to truncated field name mapping
+            geom_type: Geometry type
 
         Returns:
-            Fiona record dictionary
+            Fiona schema dictionary
         """
-        properties = {}
+        # Per-field value statistics, gathered in a single pass over features
+        stats = {original_name: _FieldStats() for original_name in field_mapping}
+        name_stats = stats.get('name')
 
-        for original_name, short_name in field_mapping.items():
-            if original_name == 'name':
-                value = feature.name
-            else:
-                value = feature.properties.get(original_name)
+        for feature in features:
+            # The 'name' field always comes from the feature name
+            if name_stats is not None:
+                name_stats.add(feature.name)
 
-            # Convert value to appropriate type
-            properties[short_name] = self._convert_value(value, schema['properties'][short_name])
+            for original_name, value in feature.properties.items():
+                if original_name != 'name':
+                    field_stats = stats.get(original_name)
+                    if field_stats is not None:
+                        field_stats.add(value)
+
+        properties = {
+            short_name: stats[original_name].field_type()
+            for original_name, short_name in field_mapping.items()
+        }
 
         return {
-            'geometry': mapping(feature.geometry),
+            'geometry': geom_type,
             'properties': properties
         }
 
-    def _convert_value(self, value: Any, field_type: str) -> Any:
+    def _field_converters(
+        self,
+        field_mapping: Dict[str, str],
+        schema: Dict
+    ) -> List[FieldConverter]:
         """
-        Convert value to match field type.
+        Choose the value converter for each field from its schema type.
 
         Args:
-            value: Original value
-            field_type: Target fiona field type
+            field_mapping: Original to truncated field name mapping
+            schema: Shapefile schema
 
         Returns:
-            Converted value
+            List of (original name, short name, converter) tuples
         """
-        if value is None:
-            return None
+        field_types = schema['properties']
+        converters: List[FieldConverter] = []
 
-        if field_type.startswith('str'):
-            return str(value)
-        elif field_type == 'int':
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-        elif field_type == 'float':
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
+        for original_name, short_name in field_mapping.items():
+            field_type = field_types[short_name]
+            convert: Callable[[Any], Any]
+            if field_type.startswith('str'):
+                convert = _to_str
+            elif field_type == 'int':
+                convert = _to_int
+            elif field_type == 'float':
+                convert = _to_float
+            else:
+                convert = _identity
+            converters.append((original_name, short_name, convert))
 
-        return value
+        return converters
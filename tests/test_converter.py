@@ -1,9 +1,12 @@
 """Tests for main converter."""
 
+import io
 import pytest
+from concurrent.futures import Future
 from pathlib import Path
 import zipfile
 
+from kmz2shapefile import converter as converter_module
 from kmz2shapefile.converter import KMZConverter
 from kmz2shapefile.exceptions import ConversionError
 
@@ -62,6 +65,33 @@ class TestKMZConverter:
         assert len(result) == 1
         assert result[0].exists()
 
+    def test_convert_kmz_prefers_doc_kml(self, converter, tmp_path):
+        """Test that doc.kml is used even when another .kml entry comes first."""
+        kmz_path = tmp_path / 'test.kmz'
+        with zipfile.ZipFile(kmz_path, 'w') as zf:
+            zf.writestr('files/other.kml', EMPTY_KML)
+            zf.writestr('DOC.KML', SIMPLE_KML)
+
+        result = converter.convert(kmz_path, tmp_path / 'output')
+        assert len(result) == 1
+
+    def test_convert_kmz_streamed_entry(self, converter, tmp_path):
+        """Test converting KMZ whose KML entry is too large to read in one go."""
+        converter.extractor.IN_MEMORY_LIMIT = 0
+        kmz_path = self._create_kmz(tmp_path, SIMPLE_KML)
+        result = converter.convert(kmz_path, tmp_path / 'output')
+        assert len(result) == 1
+        assert result[0].exists()
+
+    def test_convert_kmz_without_extension(self, converter, tmp_path):
+        """Test KMZ input is detected by signature when the suffix is unknown."""
+        kmz_path = self._create_kmz(tmp_path, SIMPLE_KML).rename(tmp_path / 'test.dat')
+        assert converter._is_kmz(kmz_path)
+        assert not converter._is_kmz(tmp_path / 'missing.dat')
+
+        result = converter.convert(kmz_path, tmp_path / 'output')
+        assert len(result) == 1
+
     def test_convert_with_attributes(self, converter, tmp_path):
         """Test converting KML with HTML table attributes."""
         kml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -98,6 +128,88 @@ class TestKMZConverter:
         result = converter.convert(kml_path, tmp_path / 'output')
         assert len(result) == 2
 
+    def test_convert_parallel_matches_sequential(self, converter, tmp_path):
+        """Test that parsing with worker processes gives the same features."""
+        placemarks = ''.join(
+            f'<Placemark><name>P{i}</name>'
+            f'<description><![CDATA[<table><tr><td>id</td><td>{i}</td></tr></table>]]>'
+            f'</description><Point><coordinates>{i},{i},0</coordinates></Point></Placemark>'
+            for i in range(10)
+        )
+        kml = (
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            f'{placemarks}<Placemark><name>Empty</name></Placemark>'
+            '</Document></kml>'
+        )
+        kml_path = tmp_path / 'test.kml'
+        kml_path.write_text(kml, encoding='utf-8')
+
+        converter.PARALLEL_THRESHOLD = 4
+        converter.PARALLEL_CHUNK_SIZE = 3
+
+        with kml_path.open('rb') as f:
+            sequential, count = converter._placemarks_to_features(
+                converter.kml_parser.iter_placemarks(f), True, False
+            )
+        with kml_path.open('rb') as f:
+            parallel, parallel_count = converter._placemarks_to_features(
+                converter.kml_parser.iter_placemarks(f), True, False, workers=2
+            )
+
+        assert count == parallel_count == 11
+        assert len(parallel) == 10
+        assert [f.name for f in parallel] == [f.name for f in sequential]
+        assert [f.properties for f in parallel] == [f.properties for f in sequential]
+        assert [f.geometry.wkt for f in parallel] == [f.geometry.wkt for f in sequential]
+
+    def test_parallel_chunks_in_flight_bounded(self, converter, monkeypatch):
+        """Test at most workers * PIPELINE_DEPTH chunks wait for collection."""
+        in_flight = []
+        peaks = []
+
+        class TrackedFuture(Future):
+            def result(self, timeout=None):
+                in_flight.pop()
+                return super().result(timeout)
+
+        class InlineExecutor:
+            """Runs chunks in-process, recording how many await collection."""
+
+            def __init__(self, max_workers, initializer):
+                initializer()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def submit(self, fn, *args):
+                future = TrackedFuture()
+                future.set_result(fn(*args))
+                in_flight.append(future)
+                peaks.append(len(in_flight))
+                return future
+
+        monkeypatch.setattr(converter_module, 'ProcessPoolExecutor', InlineExecutor)
+        converter.PARALLEL_THRESHOLD = 4
+        converter.PARALLEL_CHUNK_SIZE = 2
+
+        placemark = '<Placemark><Point><coordinates>0,0</coordinates></Point></Placemark>'
+        kml = f'<kml><Document>{placemark * 100}</Document></kml>'.encode()
+        records, count = converter._placemarks_to_records_parallel(
+            converter.kml_parser.iter_placemarks(io.BytesIO(kml)), False, workers=2
+        )
+
+        assert count == len(records) == 100
+        assert max(peaks) == 2 * converter.PIPELINE_DEPTH
+        assert not in_flight
+
+    def test_convert_all_cores(self, converter, kml_file, tmp_path):
+        """Test that workers=0 (one per core) converts small files."""
+        result = converter.convert(kml_file, tmp_path / 'output', workers=0)
+        assert len(result) == 1
+
     def test_convert_nonexistent_file_raises_error(self, converter):
         """Test that nonexistent file raises error."""
         with pytest.raises(ConversionError, match="Input file not found"):
@@ -111,6 +223,14 @@ class TestKMZConverter:
         with pytest.raises(ConversionError, match="No Placemarks found"):
             converter.convert(kml_path)
 
+    def test_convert_zero_byte_kml_raises_error(self, converter, tmp_path):
+        """Test that a zero-byte KML file raises ConversionError."""
+        kml_path = tmp_path / 'empty.kml'
+        kml_path.write_bytes(b'')
+
+        with pytest.raises(ConversionError):
+            converter.convert(kml_path, tmp_path / 'output')
+
     def test_convert_default_output_path(self, converter, kml_file):
         """Test conversion with default output path (based on input)."""
         result = converter.convert(kml_file)
@@ -137,3 +257,35 @@ class TestKMZConverter:
 
         result = converter.convert(kml_path, tmp_path / 'output', skip_null_geometry=True)
         assert len(result) == 1
+
+    def test_convert_kmz_invalid_kml_raises_error(self, converter, tmp_path):
+        """Test that a KMZ containing malformed KML raises ConversionError."""
+        kmz_path = self._create_kmz(tmp_path, "<kml><Document><Placemark>")
+
+        with pytest.raises(ConversionError):
+            converter.convert(kmz_path, tmp_path / 'output')
+
+    def test_pipeline_stops_parsing_when_merging_fails(self, converter, monkeypatch):
+        """Test a failure in the description stage stops the XML stage early."""
+        placemark = (
+            '<Placemark><name>P</name>'
+            '<Point><coordinates>0,0</coordinates></Point></Placemark>'
+        )
+        kml = f'<kml><Document>{placemark * 20000}</Document></kml>'.encode()
+        consumed = []
+
+        def placemarks():
+            for item in converter.kml_parser.iter_placemarks(io.BytesIO(kml)):
+                consumed.append(item)
+                yield item
+
+        def fail(*args):
+            raise RuntimeError('merge failed')
+
+        monkeypatch.setattr(converter_module, '_merge_attributes', fail)
+
+        with pytest.raises(RuntimeError, match='merge failed'):
+            converter._placemarks_to_records_pipelined(placemarks(), False)
+
+        limit = (converter.PIPELINE_DEPTH + 3) * converter.html_parser.BATCH_SIZE
+        assert len(consumed) <= limit
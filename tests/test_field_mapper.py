@@ -32,6 +32,16 @@ class TestFieldMapper:
         mapped_values = list(mapping.values())
         assert len(mapped_values) == len(set(mapped_values))
 
+    def test_collision_suffixes_sequential(self, mapper):
+        """Repeated collisions on one prefix should get increasing suffixes."""
+        names = [f'verylongfield{i}' for i in range(12)]
+        mapping = mapper.map_field_names(names)
+        assert mapping['verylongfield0'] == 'verylongfi'
+        assert mapping['verylongfield1'] == 'verylong_1'
+        assert mapping['verylongfield9'] == 'verylong_9'
+        assert mapping['verylongfield10'] == 'verylon_10'
+        assert len(set(mapping.values())) == len(names)
+
     def test_special_characters_cleaned(self, mapper):
         """Special characters should be replaced with underscore."""
         mapping = mapper.map_field_names(['field-name', 'field.name', 'field name'])
@@ -64,6 +74,17 @@ class TestFieldMapper:
         for orig, short in mapper.get_mapping().items():
             assert reverse[short] == orig
 
+    def test_mapping_views_read_only_and_refreshed(self, mapper):
+        """Mappings are read-only views, refreshed by each map_field_names call."""
+        mapper.map_field_names(['first'])
+        with pytest.raises(TypeError):
+            mapper.get_mapping()['other'] = 'other'
+        assert mapper.get_reverse_mapping() == {'first': 'first'}
+
+        mapper.map_field_names(['second'])
+        assert mapper.get_mapping().copy() == {'second': 'second'}
+        assert mapper.get_reverse_mapping() == {'second': 'second'}
+
     def test_unicode_characters_handled(self, mapper):
         """Unicode characters should be handled properly."""
         mapping = mapper.map_field_names(['field_name', 'nombre'])
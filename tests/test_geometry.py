@@ -1,8 +1,11 @@
 """Tests for geometry conversion."""
 
 import pytest
+import numpy as np
 from lxml import etree
-from shapely.geometry import Point, LineString, Polygon, MultiPoint, MultiLineString
+from shapely.geometry import (
+    Point, LineString, Polygon, MultiPoint, MultiLineString, GeometryCollection
+)
 
 from kmz2shapefile.geometry import GeometryConverter
 
@@ -94,6 +97,22 @@ class TestGeometryConverter:
         assert isinstance(result, Polygon)
         assert len(result.interiors) == 1
 
+    def test_convert_polygon_with_hole_without_namespace(self, converter):
+        """Test inner rings are found in KML without a namespace."""
+        kml = """
+        <Polygon>
+            <outerBoundaryIs><LinearRing>
+                <coordinates>0,0 10,0 10,10 0,10 0,0</coordinates>
+            </LinearRing></outerBoundaryIs>
+            <innerBoundaryIs><LinearRing>
+                <coordinates>2,2 8,2 8,8 2,8 2,2</coordinates>
+            </LinearRing></innerBoundaryIs>
+        </Polygon>
+        """
+        result = converter.convert(etree.fromstring(kml))
+        assert isinstance(result, Polygon)
+        assert len(result.interiors) == 1
+
     def test_convert_multigeometry_same_type(self, converter):
         """Test MultiGeometry with same geometry types."""
         kml = """
@@ -122,12 +141,112 @@ class TestGeometryConverter:
         """Test that None element returns None."""
         assert converter.convert(None) is None
 
+    def test_convert_unsupported_element(self, converter):
+        """Test that unsupported geometry tags convert to None."""
+        elem = etree.fromstring('<Model xmlns="http://www.opengis.net/kml/2.2"/>')
+        assert converter.convert(elem) is None
+
     def test_convert_without_namespace(self, converter):
         """Test conversion without KML namespace."""
         kml = "<Point><coordinates>-122.084075,37.4220033,0</coordinates></Point>"
         result = converter.convert(etree.fromstring(kml))
         assert isinstance(result, Point)
 
+    def test_parse_coordinates_drops_altitude(self, converter):
+        """Test coordinates parse to an (N, 2) array without altitude."""
+        result = converter._parse_coordinates("0,0,5 1,1,5\n\t2,2,5")
+        assert result.shape == (3, 2)
+        assert result.tolist() == [[0, 0], [1, 1], [2, 2]]
+        assert result.flags.c_contiguous
+        assert result.dtype == np.float64
+
+    def test_parse_coordinates_numpy_rejected_values(self, converter):
+        """Test regular tuples with values only float() accepts still parse."""
+        result = converter._parse_coordinates("1_0,2,0 3,4_0,0")
+        assert result.tolist() == [[10, 2], [3, 40]]
+
+    def test_parse_coordinates_numpy_rejected_mixed_lengths(self, converter):
+        """Test mixed tuple lengths with values only float() accepts stay aligned."""
+        result = converter._parse_coordinates("1_0,2,3 4,5 6,7,8,9 1_1,1_2,0")
+        assert result.tolist() == [[10, 2], [4, 5], [6, 7], [11, 12]]
+
+    def test_parse_coordinates_irregular_tuples(self, converter):
+        """Test mixed 2D/3D tuples and invalid tokens fall back gracefully."""
+        result = converter._parse_coordinates("0,0 1,1,0 bad 2,x 3,3")
+        assert result.tolist() == [[0, 0], [1, 1], [3, 3]]
+
+    @pytest.mark.parametrize('text, expected', [
+        ('1,2,3 4,5,6,7 8,9', [[1, 2], [4, 5], [8, 9]]),
+        ('1,2,3 4,5 6,7,8,9', [[1, 2], [4, 5], [6, 7]]),
+        ('1,2 3,4 5 6,7,8', [[1, 2], [3, 4], [6, 7]]),
+    ])
+    def test_parse_coordinates_mixed_lengths_not_shifted(self, converter, text, expected):
+        """Test mixed tuple lengths whose totals add up are not misaligned."""
+        assert converter._parse_coordinates(text).tolist() == expected
+
+    def test_parse_coordinates_invalid_returns_empty(self, converter):
+        """Test strings without valid tuples give an empty array instead of raising."""
+        for text in ('', '   ', 'bad x,y', '5', '1,x', '1,,2'):
+            assert converter._parse_coordinates(text).shape == (0, 2)
+
+    def test_parse_single_coordinate(self, converter):
+        """Test a single tuple parses like the vectorized path, dropping altitude."""
+        result = converter._parse_coordinates(' -122.5,37.25,10 ')
+        assert result.shape == (1, 2)
+        assert result.tolist() == [[-122.5, 37.25]]
+
+    def test_convert_invalid_geometries_return_none(self, converter):
+        """Test geometries with unusable coordinates convert to None."""
+        ns = 'xmlns="http://www.opengis.net/kml/2.2"'
+        for kml in (
+            f'<Point {ns}><coordinates>bad</coordinates></Point>',
+            f'<LineString {ns}><coordinates>0,0</coordinates></LineString>',
+            f'<Polygon {ns}><outerBoundaryIs><LinearRing>'
+            f'<coordinates>0,0 1,1</coordinates></LinearRing></outerBoundaryIs></Polygon>',
+            f'<MultiGeometry {ns}><Point><coordinates>x</coordinates></Point></MultiGeometry>',
+        ):
+            assert converter.convert(etree.fromstring(kml)) is None
+
+    def test_convert_multigeometry_mixed_types(self, converter):
+        """Test MultiGeometry with mixed types becomes a GeometryCollection."""
+        kml = """
+        <MultiGeometry xmlns="http://www.opengis.net/kml/2.2">
+            <Point><coordinates>0,0,0</coordinates></Point>
+            <LineString><coordinates>0,0,0 1,1,0</coordinates></LineString>
+        </MultiGeometry>
+        """
+        result = converter.convert(etree.fromstring(kml))
+        assert isinstance(result, GeometryCollection)
+        assert [g.geom_type for g in result.geoms] == ['Point', 'LineString']
+
+    def test_convert_polygon_unclosed_ring(self, converter):
+        """Test Polygon rings are closed when the last coordinate is omitted."""
+        kml = """
+        <Polygon><outerBoundaryIs><LinearRing>
+            <coordinates>0,0 1,0 1,1</coordinates>
+        </LinearRing></outerBoundaryIs></Polygon>
+        """
+        result = converter.convert(etree.fromstring(kml))
+        assert isinstance(result, Polygon)
+        assert len(result.exterior.coords) == 4
+
+    def test_convert_batch_aligned_with_input(self, converter):
+        """Test batch conversion keeps order and yields None for invalid input."""
+        elements = [
+            etree.fromstring("<Point><coordinates>1,2</coordinates></Point>"),
+            None,
+            etree.fromstring("<LineString><coordinates>0,0</coordinates></LineString>"),
+            etree.fromstring("<LineString><coordinates>0,0 1,1</coordinates></LineString>"),
+            etree.fromstring("<Point><coordinates>3,4</coordinates></Point>"),
+        ]
+        result = converter.convert_batch(elements)
+        assert len(result) == 5
+        assert (result[0].x, result[0].y) == (1, 2)
+        assert result[1] is None
+        assert result[2] is None
+        assert isinstance(result[3], LineString)
+        assert (result[4].x, result[4].y) == (3, 4)
+
 
 class TestGetGeometryType:
     """Tests for GeometryConverter.get_geometry_type static method."""
@@ -144,3 +263,20 @@ class TestGetGeometryType:
     def test_polygon(self):
         poly = Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)])
         assert GeometryConverter.get_geometry_type(poly) == 'Polygon'
+
+    def test_collection(self):
+        collection = GeometryCollection([Point(0, 0), LineString([(0, 0), (1, 1)])])
+        assert GeometryConverter.get_geometry_type(collection) == 'GeometryCollection'
+
+    def test_batch_matches_single(self):
+        geometries = [
+            Point(0, 0),
+            None,
+            MultiLineString([[(0, 0), (1, 1)]]),
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+            GeometryCollection([Point(0, 0)]),
+        ]
+        assert GeometryConverter.get_geometry_types(geometries) == [
+            None if g is None else GeometryConverter.get_geometry_type(g) for g in geometries
+        ]
+        assert GeometryConverter.get_geometry_types(geometries)[4] == 'GeometryCollection'
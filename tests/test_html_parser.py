@@ -55,6 +55,18 @@ class TestHTMLTableParser:
         assert isinstance(result['Price'], float)
         assert result['Latitude'] == pytest.approx(-122.084075)
 
+    def test_type_coercion_edge_cases(self, parser):
+        """Test values near the int/float boundaries."""
+        assert parser._coerce_type('1.5e3') == pytest.approx(1500.0)
+        assert parser._coerce_type('.5') == pytest.approx(0.5)
+        assert parser._coerce_type('--5') == '--5'
+        assert parser._coerce_type('1.2.3') == '1.2.3'
+        assert parser._coerce_type('1e5') == '1e5'
+        assert parser._coerce_type('192.168.0.1') == '192.168.0.1'
+        assert parser._coerce_type('+5') == '+5'
+        assert parser._coerce_type('007') == 7
+        assert parser._coerce_type('\u00b2') == '\u00b2'
+
     def test_type_coercion_null(self, parser):
         """Test null type coercion."""
         html = """
@@ -92,6 +104,68 @@ class TestHTMLTableParser:
         """Test HTML without table returns empty dict."""
         assert parser.parse_attributes("<p>Just some text</p>") == {}
 
+    def test_attribute_keys_shared_across_descriptions(self, parser):
+        """Test that repeated column names reuse one key object."""
+        first, second = parser.parse_attributes_batch([
+            '<table><tr><td>Station ID</td><td>1</td></tr></table>',
+            '<table><tr><td>Station ID</td><td>2</td></tr></table>',
+        ])
+        assert next(iter(first)) is next(iter(second))
+
+    def test_repeated_descriptions_return_independent_dicts(self, parser):
+        """Test repeated descriptions are parsed once but never share a dict."""
+        html = '<table><tr><td>Kind</td><td>Well</td></tr></table>'
+        first, second = parser.parse_attributes_batch([html, html])
+        third = parser.parse_attributes(html)
+
+        assert first == second == third == {'Kind': 'Well'}
+        first['Kind'] = 'changed'
+        assert second == third == parser.parse_attributes(html) == {'Kind': 'Well'}
+
+    def test_parse_cell_with_markup(self, parser):
+        """Test that text inside inline markup is joined like plain cell text."""
+        html = (
+            "<table><tr><td> <b>Site</b> </td>"
+            "<td><a href='#'>North</a> <i>Field</i></td></tr></table>"
+        )
+        assert parser.parse_attributes(html) == {'Site': 'NorthField'}
+
+    def test_parse_nested_table(self, parser):
+        """Test that rows wrapping a nested table are skipped, nested rows are kept."""
+        html = (
+            '<table><tr><th>Layer</th></tr>'
+            '<tr><td>Fields</td><td><table>'
+            '<tr><td>ID</td><td>7</td></tr><tr><th>Name</th><td>Well</td></tr>'
+            '</table></td></tr></table>'
+        )
+        assert parser.parse_attributes(html) == {'ID': 7, 'Name': 'Well'}
+
+    @pytest.mark.parametrize('html', [
+        '<html><body><table><tr><td>A</td><td>1</td></tr></table></body></html>'
+        '<table><tr><td>B</td><td>2</td></tr></table>',
+        '<select><table><tr><td>A</td><td>1</td></tr>'
+        '<tr><td>B</td><td>2</td></tr></table></select>',
+        '<TEXTAREA><table><tr><td>A</td><td>1</td></tr></table></TEXTAREA>'
+        '<table><tr><td>B</td><td>2</td></tr></table>',
+        '<title>Site</title><title><table><tr><td>A</td><td>1</td></tr>'
+        '<tr><td>B</td><td>2</td></tr></table></title>',
+        '<plaintext><table><tr><td>A</td><td>1</td></tr><tr><td>B</td><td>2</td></tr></table>',
+        '<xmp><table><tr><td>A</td><td>1</td></tr><tr><td>B</td><td>2</td></tr></table></xmp>',
+    ])
+    def test_rows_inside_raw_text_tags_kept(self, parser, html):
+        """Test rows libxml2 would swallow as raw text or after </html> are kept."""
+        assert parser.parse_attributes(html) == {'A': 1, 'B': 2}
+        assert parser.parse_attributes_batch([html, html]) == [{'A': 1, 'B': 2}] * 2
+
+    def test_parse_uppercase_table(self, parser):
+        """Test table markup is recognised regardless of tag case."""
+        html = "<TABLE><TR><TD>Key</TD><TD>Value</TD></TR></TABLE>"
+        assert parser.parse_attributes(html) == {'Key': 'Value'}
+
+    def test_parse_plain_text(self, parser):
+        """Test description without any markup returns empty dict."""
+        assert parser.parse_attributes("Plain description") == {}
+
     def test_parse_malformed_html(self, parser):
         """Test malformed HTML is handled gracefully."""
         result = parser.parse_attributes("<table><tr><td>Key<td>Value</tr></table")
@@ -109,6 +183,27 @@ class TestHTMLTableParser:
         assert '' not in result
         assert 'Key' in result
 
+    def test_parse_attributes_batch(self, parser):
+        """Test batch parsing matches per-description parsing, in order."""
+        descriptions = [
+            "<table><tr><td>Name</td><td>John</td></tr></table>",
+            None,
+            "<p>Just some text</p>",
+            "<table><tr><th>Count</th><td>42</td></tr>"
+            "<tr><td>Empty</td><td><Null></td></tr></table>",
+        ]
+        result = parser.parse_attributes_batch(descriptions)
+        assert result == [{'Name': 'John'}, {}, {}, {'Count': 42, 'Empty': None}]
+
+    def test_parse_attributes_batch_unclosed_table(self, parser):
+        """Test an unclosed table does not leak rows into later descriptions."""
+        descriptions = [
+            "<table><tr><td>First</td><td>1</td></tr>",
+            "<table><tr><td>Second</td><td>2</td></tr></table>",
+        ]
+        result = parser.parse_attributes_batch(descriptions)
+        assert result == [{'First': 1}, {'Second': 2}]
+
 
 class TestExtendedDataParser:
     """Tests for HTMLTableParser.parse_extended_data()."""
@@ -144,3 +239,15 @@ class TestExtendedDataParser:
         """
         result = parser.parse_extended_data(etree.fromstring(xml))
         assert result == {'Category': 'Residential'}
+
+    def test_parse_mixed_data_in_document_order(self, parser):
+        """Test Data and SimpleData fields keep document order."""
+        xml = """
+        <ExtendedData xmlns="http://www.opengis.net/kml/2.2">
+            <Data name="b"><displayName>B</displayName><value>2</value></Data>
+            <SchemaData><SimpleData name="a">1</SimpleData></SchemaData>
+            <Data name="c"><value>3</value></Data>
+        </ExtendedData>
+        """
+        result = parser.parse_extended_data(etree.fromstring(xml))
+        assert list(result.items()) == [('b', 2), ('a', 1), ('c', 3)]
@@ -1,6 +1,9 @@
 """Tests for KML parsing."""
 
+import io
+
 import pytest
+from lxml import etree
 
 from kmz2shapefile.kml_parser import KMLParser, Placemark
 from kmz2shapefile.exceptions import KMLParseError
@@ -35,8 +38,14 @@ class TestKMLParser:
         kml = """<?xml version="1.0" encoding="UTF-8"?>
         <kml xmlns="http://www.opengis.net/kml/2.2">
             <Document>
-                <Placemark><name>Point 1</name><Point><coordinates>0,0,0</coordinates></Point></Placemark>
-                <Placemark><name>Point 2</name><Point><coordinates>1,1,0</coordinates></Point></Placemark>
+                <Placemark>
+                    <name>Point 1</name>
+                    <Point><coordinates>0,0,0</coordinates></Point>
+                </Placemark>
+                <Placemark>
+                    <name>Point 2</name>
+                    <Point><coordinates>1,1,0</coordinates></Point>
+                </Placemark>
             </Document>
         </kml>
         """
@@ -84,6 +93,17 @@ class TestKMLParser:
         with pytest.raises(KMLParseError):
             parser.parse("not valid xml")
 
+    def test_parse_malformed_xml_with_recover(self):
+        """Test that recover mode keeps placemarks before a syntax error."""
+        kml = (
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            '<Placemark><name>Good</name><Point><coordinates>1,2</coordinates></Point>'
+            '</Placemark>\x03<Placemark><name>Cut'
+        )
+        placemarks = KMLParser(recover=True).parse(kml)
+        assert placemarks[0].name == 'Good'
+        assert placemarks[0].geometry_element is not None
+
     def test_parse_empty_document(self, parser):
         """Test parsing document with no placemarks."""
         kml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -124,3 +144,63 @@ class TestKMLParser:
         result = parser.parse(kml)
         assert len(result) == 1
         assert result[0].name == "Unnamed"
+
+    def test_iter_placemarks_from_stream(self, parser):
+        """Test streaming placemarks keeps geometry usable after parsing moves on."""
+        kml = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <kml xmlns="http://www.opengis.net/kml/2.2">
+            <Document>
+                <Placemark>
+                    <name>Point 1</name>
+                    <Point><coordinates>0,0,0</coordinates></Point>
+                </Placemark>
+                <Placemark>
+                    <name>Point 2</name>
+                    <Point><coordinates>1,1,0</coordinates></Point>
+                </Placemark>
+            </Document>
+        </kml>
+        """
+        result = list(parser.iter_placemarks(io.BytesIO(kml)))
+        assert [p.name for p in result] == ["Point 1", "Point 2"]
+        coords = [p.geometry_element[0].text for p in result]
+        assert coords == ["0,0,0", "1,1,0"]
+
+    def test_iter_placemarks_across_folders(self, parser):
+        """Test streaming placemarks from nested folders frees earlier elements."""
+        kml = b"""<kml xmlns="http://www.opengis.net/kml/2.2"><Document>
+            <Style id="s"/>
+            <Folder><Placemark><name>A</name><Point><coordinates>0,0</coordinates></Point></Placemark></Folder>
+            <Folder><Folder><Placemark><name>B</name><Point><coordinates>1,1</coordinates></Point></Placemark></Folder></Folder>
+            <Placemark><name>C</name><Point><coordinates>2,2</coordinates></Point></Placemark>
+        </Document></kml>"""
+        placemarks = parser.iter_placemarks(io.BytesIO(kml))
+        result = [next(placemarks), next(placemarks), next(placemarks)]
+        document = result[2].geometry_element.getparent().getparent()
+        assert list(placemarks) == []
+
+        # Only the last (cleared) Placemark is left in the document
+        assert len(document) == 1
+        assert [p.name for p in result] == ["A", "B", "C"]
+        assert [p.geometry_element[0].text for p in result] == ["0,0", "1,1", "2,2"]
+
+    def test_parse_ignores_comments_and_keeps_escaped_text(self, parser):
+        """Test comments are dropped while predefined entities still decode."""
+        kml = """<kml xmlns="http://www.opengis.net/kml/2.2"><Document>
+            <Placemark><!-- note --><name>A &amp; B</name>
+            <Point><!-- c --><coordinates>1,2</coordinates></Point></Placemark>
+        </Document></kml>"""
+        placemark = parser.parse(kml)[0]
+        assert placemark.name == "A & B"
+        assert [child.text for child in placemark.geometry_element] == ["1,2"]
+
+    def test_geometry_priority_independent_of_order(self, parser):
+        """Test MultiGeometry is preferred even when a Point comes first."""
+        kml = """<kml xmlns="http://www.opengis.net/kml/2.2"><Placemark>
+            <Point><coordinates>0,0</coordinates></Point>
+            <MultiGeometry><Point><coordinates>1,1</coordinates></Point></MultiGeometry>
+            <name>First</name><name>Second</name>
+        </Placemark></kml>"""
+        placemark = parser.parse(kml)[0]
+        assert placemark.name == "First"
+        assert etree.QName(placemark.geometry_element).localname == "MultiGeometry"
@@ -1,11 +1,16 @@
 """Tests for Shapefile building."""
 
+import numpy as np
 import pytest
 from pathlib import Path
-from shapely.geometry import Point, LineString, Polygon, GeometryCollection
+from shapely.geometry import (
+    Point, LineString, Polygon, GeometryCollection, MultiLineString, MultiPoint
+)
 import fiona
 
-from kmz2shapefile.shapefile_builder import ShapefileBuilder, Feature
+from kmz2shapefile.shapefile_builder import (
+    ShapefileBuilder, Feature, _geometries_to_geojson, _geometry_to_geojson
+)
 from kmz2shapefile.exceptions import ShapefileWriteError
 
 
@@ -134,3 +139,211 @@ class TestShapefileBuilder:
             assert 42 in values or '42' in values
             assert any(abs(float(v) - 3.14) < 0.01 for v in values if isinstance(v, (int, float)))
             assert 'test' in values
+
+    def test_records_written_in_order(self, builder, tmp_path):
+        """Test that all records are written, in feature order."""
+        features = [
+            Feature(geometry=Point(i, i), properties={'value': i}, name=f'P{i}')
+            for i in range(5)
+        ]
+        result = builder.build_shapefiles(features, tmp_path / 'test')
+
+        with fiona.open(result[0]) as src:
+            assert [rec['properties']['value'] for rec in src] == [0, 1, 2, 3, 4]
+
+    def test_schema_field_types_inferred(self, builder):
+        """Test field types are inferred from values across all features."""
+        features = [
+            Feature(geometry=Point(0, 0), properties={'a': 1, 'b': 1, 'c': None}, name='x' * 100),
+            Feature(geometry=Point(1, 1), properties={'a': 2.5, 'b': 'text', 'd': True}, name='y'),
+        ]
+        mapping = {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd', 'name': 'name'}
+        schema = builder._build_schema(features, mapping, 'Point')
+
+        assert schema['properties'] == {
+            'a': 'float',
+            'b': 'str:90',
+            'c': 'str:80',
+            'd': 'str:90',
+            'name': 'str:110',
+        }
+
+    def test_schema_field_type_for_subclassed_values(self, builder):
+        """Test values of int/float/str subclasses are typed like their base."""
+        class Label(str):
+            pass
+
+        features = [
+            Feature(
+                geometry=Point(0, 0),
+                properties={'f': np.float64(1.5), 's': Label('x')},
+                name='a'
+            ),
+        ]
+        mapping = {'f': 'f', 'name': 'name', 's': 's'}
+        schema = builder._build_schema(features, mapping, 'Point')
+
+        assert schema['properties'] == {'f': 'float', 'name': 'str:90', 's': 'str:90'}
+
+    def test_field_values_converted_to_schema_types(self, builder):
+        """Test record values are converted to their field's schema type."""
+        feature = Feature(
+            geometry=Point(0, 0),
+            properties={'count': '7', 'ratio': 'n/a', 'code': 12},
+            name='Site'
+        )
+        mapping = {'code': 'code', 'count': 'count', 'name': 'name', 'ratio': 'ratio'}
+        schema = {
+            'geometry': 'Point',
+            'properties': {'code': 'str:80', 'count': 'int', 'name': 'str:80', 'ratio': 'float'},
+        }
+        converters = builder._field_converters(mapping, schema)
+        record = next(builder._iter_records([feature], converters))
+
+        assert record['properties'] == {'code': '12', 'count': 7, 'name': 'Site', 'ratio': None}
+
+    def test_polygon_with_hole_written(self, builder, tmp_path):
+        """Test polygon interior rings survive the write."""
+        polygon = Polygon(
+            [(0, 0), (4, 0), (4, 4), (0, 4)],
+            [[(1, 1), (2, 1), (2, 2), (1, 2)]]
+        )
+        features = [Feature(geometry=polygon, properties={}, name='Holed')]
+        result = builder.build_shapefiles(features, tmp_path / 'test')
+
+        with fiona.open(result[0]) as src:
+            rings = next(iter(src))['geometry']['coordinates']
+            assert len(rings) == 2
+            assert Polygon(rings[0], rings[1:]).area == pytest.approx(polygon.area)
+
+    def test_nested_geometry_collection_expanded(self, builder):
+        """Test nested collections are flattened in order, sharing properties."""
+        properties = {'source': 'nested'}
+        collection = GeometryCollection([
+            Point(0, 0),
+            GeometryCollection([Point(1, 1), LineString([(0, 0), (1, 1)])]),
+            Point(2, 2),
+        ])
+        features = [Feature(geometry=collection, properties=properties, name='C')]
+        grouped = builder._group_by_geometry_type(features)
+
+        assert [f.name for f in grouped['Point']] == ['C_0', 'C_1_0', 'C_2']
+        assert [f.name for f in grouped['LineString']] == ['C_1_1']
+        assert all(f.properties is properties for f in grouped['Point'])
+
+    def test_parallel_write_matches_sequential(self, builder, tmp_path):
+        """Test per-type Shapefiles written in worker threads match sequential output."""
+        features = [
+            Feature(geometry=Point(0, 0), properties={'value': 1}, name='P'),
+            Feature(geometry=LineString([(0, 0), (1, 1)]), properties={'value': 2}, name='L'),
+        ]
+        sequential = builder.build_shapefiles(features, tmp_path / 'seq')
+        parallel = builder.build_shapefiles(features, tmp_path / 'par', workers=2)
+
+        assert [p.name.replace('par', 'seq') for p in parallel] == [p.name for p in sequential]
+        for seq_path, par_path in zip(sequential, parallel):
+            with fiona.open(seq_path) as seq, fiona.open(par_path) as par:
+                assert [dict(f['properties']) for f in par] == [dict(f['properties']) for f in seq]
+
+    def test_unknown_engine_raises_error(self):
+        """Test an unknown writer engine is rejected."""
+        with pytest.raises(ValueError):
+            ShapefileBuilder(engine='shapelib')
+
+    def test_default_engine_is_fiona(self):
+        """Test pyogrio is only used when asked for, whether or not it is installed."""
+        assert ShapefileBuilder().engine == 'fiona'
+
+    def test_pyogrio_engine_matches_fiona(self, tmp_path):
+        """Test the pyogrio writer produces byte-identical files to fiona."""
+        pytest.importorskip('pyogrio')
+        features = [
+            Feature(geometry=Point(0, 0, 3), properties={'count': 1, 'label': 'a'}, name='P1'),
+            Feature(geometry=Point(1, 1), properties={'ratio': 0.5, 'note': 'x' * 120}, name='P2'),
+            Feature(geometry=Point(2, 2), properties={'note': '\u00e9' * 100}, name='\u6771\u4eac'),
+            Feature(
+                geometry=LineString([(0, 0), (1, 1)]), properties={'count': None}, name='L1'
+            ),
+            Feature(
+                geometry=MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+                properties={'count': 2},
+                name='L2'
+            ),
+        ]
+        fiona_out = ShapefileBuilder('fiona').build_shapefiles(features, tmp_path / 'fiona')
+        pyogrio_out = ShapefileBuilder('pyogrio').build_shapefiles(features, tmp_path / 'pyogrio')
+
+        assert len(fiona_out) == len(pyogrio_out) == 2
+        for expected, actual in zip(fiona_out, pyogrio_out):
+            for suffix in ('.shp', '.shx', '.dbf', '.prj', '.cpg'):
+                assert actual.with_suffix(suffix).read_bytes() == \
+                    expected.with_suffix(suffix).read_bytes()
+
+    @pytest.mark.parametrize('engine', ['fiona', 'pyogrio'])
+    def test_mixed_point_and_multipoint_rejected(self, engine, tmp_path):
+        """Test both engines refuse MultiPoints in a Point layer."""
+        if engine == 'pyogrio':
+            pytest.importorskip('pyogrio')
+        features = [
+            Feature(geometry=Point(0, 0), properties={}, name='single'),
+            Feature(geometry=MultiPoint([(1, 1), (2, 2)]), properties={}, name='multi'),
+        ]
+        with pytest.raises(ShapefileWriteError, match="'MultiPoint' != 'Point'"):
+            ShapefileBuilder(engine).build_shapefiles(features, tmp_path / 'out')
+
+    def test_property_columns(self, builder):
+        """Test properties are pivoted into per-field columns in feature order."""
+        features = [
+            Feature(geometry=Point(0, 0), properties={'a': 1, 'name': 'ignored'}, name='first'),
+            Feature(geometry=Point(1, 1), properties={'b': 'x'}, name='second'),
+        ]
+        mapping = {'a': 'a', 'b': 'b', 'name': 'name'}
+        schema = builder._build_schema(features, mapping, 'Point')
+        columns = builder._property_columns(features, builder._field_converters(mapping, schema))
+
+        assert {k: list(v) for k, v in columns.items()} == {
+            'a': [1, None],
+            'b': [None, 'x'],
+            'name': ['first', 'second'],
+        }
+
+    def test_schema_string_width_capped(self, builder):
+        """Test string fields are capped at the DBF maximum width."""
+        features = [
+            Feature(geometry=Point(0, 0), properties={'s': 'x' * 300, 'm': 1}, name='a'),
+            Feature(geometry=Point(1, 1), properties={'s': 'y' * 10, 'm': 'text'}, name='b'),
+            Feature(geometry=Point(2, 2), properties={'s': 2.5, 'm': 3.5}, name='c'),
+        ]
+        mapping = {'m': 'm', 'name': 'name', 's': 's'}
+        schema = builder._build_schema(features, mapping, 'Point')
+
+        assert schema['properties'] == {'m': 'str:90', 'name': 'str:90', 's': 'str:254'}
+
+    def test_fields_in_first_seen_order(self, tmp_path):
+        """Test fields keep first-seen order when sorting is disabled."""
+        features = [
+            Feature(geometry=Point(0, 0), properties={'zeta': 1, 'alpha': 2}, name='a'),
+            Feature(geometry=Point(1, 1), properties={'mid': 3, 'zeta': 4}, name='b'),
+        ]
+        sorted_out = ShapefileBuilder('fiona').build_shapefiles(features, tmp_path / 'sorted')
+        ordered_out = ShapefileBuilder('fiona', sort_fields=False).build_shapefiles(
+            features, tmp_path / 'ordered'
+        )
+
+        with fiona.open(sorted_out[0]) as src:
+            assert list(src.schema['properties']) == ['alpha', 'mid', 'name', 'zeta']
+        with fiona.open(ordered_out[0]) as src:
+            assert list(src.schema['properties']) == ['name', 'zeta', 'alpha', 'mid']
+
+    @pytest.mark.parametrize('geometries', [
+        [Point(0, 0), Point(1, 2)],
+        [Point(0, 0, 5), Point(1, 2, 6)],
+        [LineString([(0, 0), (1, 1)]), LineString([(2, 2), (3, 3), (4, 4)])],
+        [Point(0, 0), Point(1, 1, 1), LineString([(0, 0), (1, 1)])],
+        [Point(0, 0), Point()],
+    ])
+    def test_batch_geometry_conversion_matches_single(self, geometries):
+        """Test batch geometry conversion matches per-geometry conversion."""
+        assert _geometries_to_geojson(geometries) == [
+            _geometry_to_geojson(geom) for geom in geometries
+        ]